@@ -5,7 +5,10 @@ Each node is a function that processes the state and returns updated state.
 
 from typing import Dict, Any, Optional
 from datetime import datetime, timedelta
+from collections import defaultdict
 import json
+import re
+import traceback
 import pytz
 from dateutil import parser
 
@@ -246,7 +249,6 @@ def detect_reference_query_pattern(message: str) -> bool:
     Detect if a message contains reference query patterns.
     Returns True if patterns like "before my", "after the", event names in quotes are found.
     """
-    import re
     
     message_lower = message.lower()
     
@@ -281,7 +283,6 @@ def detect_recurring_meeting_pattern(message: str) -> Optional[str]:
     Detect if user is referring to a recurring/usual meeting type.
     Returns the meeting keyword if detected, None otherwise.
     """
-    import re
     
     message_lower = message.lower()
     
@@ -664,7 +665,6 @@ def extract_requirements(state: SchedulerState) -> SchedulerState:
                     if slots and confirmed_time:
                         # Parse confirmed hour and minute (handle AM/PM format like 5PM, 5:00PM, 17:00, etc.)
                         try:
-                            import re
                             # Remove extra spaces and normalize
                             time_str = confirmed_time.strip().upper()
                             
@@ -803,7 +803,6 @@ def extract_requirements(state: SchedulerState) -> SchedulerState:
                                 logger.warning(f"⚠️ Could not parse time format: {confirmed_time}")
                         except Exception as e:
                             logger.error(f"❌ CRITICAL: Could not filter slots by confirmed time: {e}")
-                            import traceback
                             logger.error(f"Exception details: {traceback.format_exc()}")
                             
                             # ALWAYS ask user to select from available slots when error occurs
@@ -1139,7 +1138,6 @@ def extract_requirements(state: SchedulerState) -> SchedulerState:
                 # Only filter if we have slots AND the time is specified (supports formats like 5PM, 5:00PM, 17:00)
                 if slots and new_time:
                     try:
-                        import re
                         time_str = str(new_time).strip().upper()
                         # Match time formats: 5PM, 5:00PM, 17:00, 5:30 PM, etc.
                         match = re.match(r'(\d{1,2}):?(\d{2})?\s*(AM|PM)?', time_str)
@@ -1205,13 +1203,15 @@ def extract_requirements(state: SchedulerState) -> SchedulerState:
             # ============================================================
             # EDGE CASE VALIDATION (Tests 5.1, 5.2, 5.3)
             # ============================================================
-            validator = EdgeCaseValidator(timezone=state["timezone"])
+            # Read the clock once for this node; the validator and the date-range math below share it
+            now = datetime.now(pytz.timezone('Asia/Kolkata'))
+            validator = EdgeCaseValidator(timezone=state["timezone"], now=now)
             
             # Prepare validation inputs
             parsed_date_obj = None
             if state.get("preferred_date"):
                 try:
-                    tz = pytz.timezone(state["timezone"])
+                    tz = validator.timezone
                     parsed_date_obj = datetime.strptime(state["preferred_date"], "%Y-%m-%d")
                     parsed_date_obj = tz.localize(parsed_date_obj)
                 except Exception as e:
@@ -1325,8 +1325,6 @@ def extract_requirements(state: SchedulerState) -> SchedulerState:
                     
                     if "next week" in date_range.lower():
                         # Calculate next week's Monday and Friday (use IST timezone)
-                        ist_tz = pytz.timezone('Asia/Kolkata')
-                        now = datetime.now(ist_tz)
                         days_until_monday = (7 - now.weekday()) % 7 + 7  # Next Monday
                         next_monday = now + timedelta(days=days_until_monday)
                         next_friday = next_monday + timedelta(days=4)
@@ -1342,8 +1340,6 @@ def extract_requirements(state: SchedulerState) -> SchedulerState:
                         )
                     elif "this week" in date_range.lower():
                         # Calculate this week's remaining days (use IST timezone)
-                        ist_tz = pytz.timezone('Asia/Kolkata')
-                        now = datetime.now(ist_tz)
                         # Start from today or tomorrow
                         start_day = now + timedelta(days=1)
                         # End on Friday
@@ -1380,9 +1376,6 @@ def extract_requirements(state: SchedulerState) -> SchedulerState:
                 
                 if week_context:
                     # Auto-calculate date range
-                    ist_tz = pytz.timezone('Asia/Kolkata')
-                    now = datetime.now(ist_tz)
-                    
                     if week_context == "next week":
                         # Calculate next week's Monday to Friday
                         days_until_monday = (7 - now.weekday()) % 7 + 7  # Next Monday
@@ -2169,8 +2162,6 @@ def handle_named_event_reference(state: SchedulerState, calendar: GoogleCalendar
     """
     logger.info(f"Searching for named event: '{event_name}'")
     
-    import re
-    
     # Search for the event in calendar (next 30 days, use IST timezone)
     ist_tz = pytz.timezone('Asia/Kolkata')
     now = datetime.now(ist_tz)
@@ -2497,8 +2488,6 @@ def handle_reference_query(state: SchedulerState, calendar: GoogleCalendarTool,
     """
     logger.info("Handling reference query")
     
-    import re
-    
     # Strategy 1: Check for named event references (in quotes or specific patterns)
     # Pattern: "after the 'Event Name'" or "before my 'Event Name'" or "after Event Name"
     event_name_patterns = [
@@ -2798,7 +2787,6 @@ def suggest_times(state: SchedulerState) -> SchedulerState:
                 if is_multi_day and len(slots) > 0:
                     # Multi-day search - present options across days concisely
                     # Group slots by day for better presentation
-                    from collections import defaultdict
                     slots_by_day = defaultdict(list)
                     for slot in slots[:5]:  # Top 5 slots
                         day_name = datetime.fromisoformat(slot['start']).strftime("%A")
@@ -3202,7 +3190,6 @@ def create_event(state: SchedulerState) -> SchedulerState:
         
         # If user specified a time, try to match it
         if time_preference:
-            import re
             # Parse the requested time
             time_str = str(time_preference).strip().upper()
             # Match formats like: 5PM, 5:00PM, 17:00, 5:30 PM, etc.
@@ -3413,7 +3400,6 @@ def create_event(state: SchedulerState) -> SchedulerState:
             logger.info(f"📌 No specific time requested, using first available slot: {selected_slot['start_formatted']}")
         
         # Parse times and ensure they're timezone-aware (IST)
-        import pytz
         tz = pytz.timezone(state["timezone"])
         
         start_time = datetime.fromisoformat(selected_slot["start"])
@@ -129,8 +129,6 @@ class OAuthManager:
         return False
     
     def get_user_info(self, credentials: Credentials) -> Dict[str, Any]:
-        from googleapiclient.discovery import build
-        
         service = build('oauth2', 'v2', credentials=credentials)
         user_info = service.userinfo().get().execute()
         
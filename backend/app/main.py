@@ -5,20 +5,29 @@ Handles OAuth, WebSocket voice interface, and agent orchestration.
 
 from fastapi import FastAPI, WebSocket, WebSocketDisconnect, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import RedirectResponse, JSONResponse
+from fastapi.responses import RedirectResponse, JSONResponse, HTMLResponse
+from prometheus_client import start_http_server
 from typing import Dict, Optional
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 import asyncio
 import json
+import traceback
 import uuid
 import time
 
+try:
+    import uvloop  # POSIX-only; libuv-based loop for the STT/TTS callback and streaming paths
+except ImportError:
+    uvloop = None
+
 from .auth.oauth import oauth_manager
-from .agent.graph import run_agent, create_initial_state
+from .agent.graph import run_agent, create_initial_state, scheduling_agent
 from .agent.state import SchedulerState
 from .agent.nodes import load_calendar_context
 from .voice.deepgram_client import deepgram_manager
 from .voice.deepgram_tts_client import deepgram_tts_manager
-from .voice.tts_client import tts_manager  # Fallback to Google TTS if needed
+from .voice.tts_client import get_tts_manager  # Fallback to Google TTS if needed
 from .utils.config import settings
 from .utils.logger import logger
 from .utils.debug_events import debug_emitter, emit_message
@@ -45,6 +54,8 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+WELCOME_TEXT = "Hello! I'm your scheduling assistant. How can I help you schedule a meeting today?"
+
 # In-memory session storage (use Redis in production)
 active_sessions: Dict[str, SchedulerState] = {}
 user_sessions: Dict[str, str] = {}  # Maps session_id to user_id
@@ -282,7 +293,6 @@ async def voice_websocket(websocket: WebSocket, user_id: str):
                 
             except Exception as e:
                 logger.error(f"❌ Error processing utterance: {e}")
-                import traceback
                 logger.error(f"Stack trace: {traceback.format_exc()}")
                 await websocket.send_json({
                     "type": "error",
@@ -409,7 +419,6 @@ async def voice_websocket(websocket: WebSocket, user_id: str):
             
         except Exception as e:
             logger.error(f"❌ Error processing utterance: {e}")
-            import traceback
             logger.error(f"Stack trace: {traceback.format_exc()}")
             await websocket.send_json({
                 "type": "error",
@@ -531,7 +540,7 @@ async def voice_websocket(websocket: WebSocket, user_id: str):
     
     try:
         # Prepare welcome message (but wait for frontend to be ready)
-        welcome_text = "Hello! I'm your scheduling assistant. How can I help you schedule a meeting today?"
+        welcome_text = WELCOME_TEXT
         greeting_sent = False
         
         # Main WebSocket loop
@@ -825,7 +834,6 @@ async def process_with_agent(websocket: WebSocket, session_id: str, user_message
         })
         
         # Run agent synchronously (LangGraph handles its own threading)
-        from .agent.graph import scheduling_agent
         result = scheduling_agent.invoke(state)
         
         # Update session state
@@ -886,7 +894,6 @@ async def process_with_agent(websocket: WebSocket, session_id: str, user_message
                 logger.info("✅ Voice response completed successfully")
             except Exception as tts_error:
                 logger.error(f"❌ CRITICAL TTS Error: {tts_error}")
-                import traceback
                 logger.error(f"❌ Full Traceback:\n{traceback.format_exc()}")
                 # Try to notify frontend of the error
                 try:
@@ -1002,26 +1009,20 @@ async def send_voice_response(websocket: WebSocket, text: str):
         except Exception as streaming_error:
             # Fallback to Google TTS if Deepgram fails
             logger.error(f"❌ [TTS] Deepgram streaming failed: {streaming_error}")
-            import traceback
             logger.error(f"[TTS] Traceback: {traceback.format_exc()}")
             logger.info("🔄 [TTS] Falling back to Google TTS...")
             
             try:
-                import base64
-                audio_bytes = await asyncio.to_thread(
-                    tts_manager.client.synthesize_speech,
-                    text
-                )
-                logger.info(f"✅ [TTS] Google TTS generated {len(audio_bytes)} bytes")
-                audio_base64 = base64.b64encode(audio_bytes).decode('utf-8')
+                google_tts = get_tts_manager()
+                if google_tts is None:
+                    raise Exception("Google TTS is not available")
                 
-                await websocket.send_json({
-                    "type": "audio",
-                    "audio": audio_base64,
-                    "format": "pcm16",
-                    "fallback": True
-                })
-                logger.info("✅ [TTS] Fallback audio sent successfully")
+                # Same binary PCM frames as the Deepgram path, so playback starts on the first chunk
+                chunk_count = 0
+                async for audio_chunk in google_tts.synthesize_streaming(text):
+                    await websocket.send_bytes(audio_chunk)
+                    chunk_count += 1
+                logger.info(f"✅ [TTS] Fallback audio streamed ({chunk_count} chunks)")
             except Exception as fallback_error:
                 logger.error(f"❌ [TTS] Fallback TTS also failed: {fallback_error}")
                 logger.error(f"[TTS] Fallback traceback: {traceback.format_exc()}")
@@ -1041,7 +1042,6 @@ async def send_voice_response(websocket: WebSocket, text: str):
     
     except Exception as e:
         logger.error(f"❌ [TTS] EXCEPTION in send_voice_response: {e}")
-        import traceback
         logger.error(f"❌ [TTS] Exception Traceback:\n{traceback.format_exc()}")
         # Try to send error message, but don't fail if connection is closed
         try:
@@ -1102,7 +1102,6 @@ async def chat(request: Request):
         emit_message("user", message)
         
         # Run agent
-        from .agent.graph import scheduling_agent
         result = scheduling_agent.invoke(state)
         
         # Update session
@@ -1149,9 +1148,6 @@ async def get_sessions(user_id: str):
 
 # Debug Dashboard
 
-from fastapi.responses import HTMLResponse
-from pathlib import Path
-
 @app.get("/debug", response_class=HTMLResponse)
 async def debug_dashboard():
     """Serve the debug dashboard."""
@@ -1184,22 +1180,20 @@ async def debug_websocket(websocket: WebSocket):
         }
     })
     
-    # Create listener for debug events
-    async def send_event(event):
+    # Every event frame has the same shape, {"type": "events", "events": [...]}, however many it carries
+    async def send_events(events):
         try:
-            await websocket.send_json(event)
+            await websocket.send_json({"type": "events", "events": events})
         except:
             pass  # Connection closed
     
     # Register listener
-    debug_emitter.add_listener(send_event)
+    debug_emitter.add_listener(send_events)
     
     # Send event history
-    for event in debug_emitter.get_history():
-        try:
-            await websocket.send_json(event)
-        except:
-            break
+    history = debug_emitter.get_history()
+    if history:
+        await send_events(history)
     
     try:
         # Keep connection alive
@@ -1214,7 +1208,7 @@ async def debug_websocket(websocket: WebSocket):
     except WebSocketDisconnect:
         logger.info("Debug WebSocket client disconnected")
     finally:
-        debug_emitter.remove_listener(send_event)
+        debug_emitter.remove_listener(send_events)
 
 # Application Startup
 
@@ -1224,6 +1218,27 @@ async def startup_event():
     logger.info("Starting Smart Scheduler AI Agent")
     logger.info(f"Frontend URL: {settings.frontend_url}")
     logger.info(f"Environment: {settings.environment}")
+    
+    debug_emitter.history_enabled = settings.debug_event_history
+    
+    # asyncio.to_thread (Deepgram connect/finish, sync TTS) runs here; size it so concurrent calls don't queue
+    asyncio.get_running_loop().set_default_executor(
+        ThreadPoolExecutor(max_workers=settings.executor_workers, thread_name_prefix="worker")
+    )
+    deepgram_manager.start_warm_pool(settings.deepgram_warm_pool_size)
+    
+    # Metrics get their own port so they're never reachable through the public app
+    if settings.metrics_port:
+        start_http_server(settings.metrics_port)
+        logger.info(f"Prometheus metrics on port {settings.metrics_port}")
+    
+    # Synthesize the greeting in the background so the first session doesn't wait on TTS
+    app.state.tts_prewarm = asyncio.create_task(deepgram_tts_manager.prewarm([WELCOME_TEXT]))
+    
+    # Open the Google TTS fallback channel now rather than during the first Deepgram outage
+    google_tts = get_tts_manager()
+    if google_tts is not None:
+        app.state.google_tts_warmup = asyncio.create_task(google_tts.warmup())
 
 @app.on_event("shutdown")
 async def shutdown_event():
@@ -1233,6 +1248,9 @@ async def shutdown_event():
     # Close all Deepgram sessions
     for session_id in list(deepgram_manager.sessions.keys()):
         await deepgram_manager.end_session(session_id)
+    await deepgram_manager.close_warm_pool()
+    
+    await deepgram_tts_manager.aclose()
 
 if __name__ == "__main__":
     import uvicorn
@@ -1242,5 +1260,6 @@ if __name__ == "__main__":
         host=settings.host,
         port=settings.port,
         reload=settings.environment == "development",
-        log_level="info"
+        log_level="info",
+        loop="uvloop" if uvloop else "asyncio"
     )
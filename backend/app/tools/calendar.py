@@ -3,6 +3,7 @@ from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
 from datetime import datetime, timedelta
 from typing import List, Dict, Optional, Any, Tuple
+from collections import Counter
 import pytz
 from dateutil import parser
 
@@ -59,8 +60,6 @@ class GoogleCalendarTool:
     
     def analyze_recurring_meeting_pattern(self, meeting_keyword: str, lookback_days: int = 60) -> Optional[int]:
         try:
-            from collections import Counter
-            
             ist_tz = pytz.timezone('Asia/Kolkata')
             end_time = datetime.now(ist_tz)
             start_time = end_time - timedelta(days=lookback_days)
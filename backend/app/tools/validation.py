@@ -1,28 +1,68 @@
 from datetime import datetime, timedelta
 from typing import Optional, Dict, Any, Tuple
+from functools import lru_cache
+import logging
 import pytz
 import re
 
 from ..utils.logger import logger
 
+# Keyword checks as single-pass substring alternations
+_PAST_RE = re.compile(r'last|past|yesterday|previous')
+_TIME_INDICATOR_RE = re.compile(r'at|around|about|approximately')
+
+# English names indexed by datetime.weekday() / datetime.month, avoiding locale-aware strftime
+_WEEKDAY = ('Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday')
+_MONTH = ('', 'January', 'February', 'March', 'April', 'May', 'June',
+          'July', 'August', 'September', 'October', 'November', 'December')
+
+# Out-of-range time mentions, checked in order against the lowercased message
+_INVALID_TIME_PATTERNS = (
+    (re.compile(r'(\d+)\s*o[\'\']?\s*clock'), lambda m: int(m.group(1)) > 24 or int(m.group(1)) == 0),
+    (re.compile(r'(?<![:\d])(\d+)\s*(?:pm|am)(?!\d)'), lambda m: int(m.group(1)) > 12 or int(m.group(1)) == 0),
+    (re.compile(r'(\d+):(\d+)'), lambda m: int(m.group(1)) >= 24 or int(m.group(2)) >= 60),
+)
+_TIME_REFERENCE_RE = re.compile(r'(?:at|around|about)\s+(\d+)(?:\s|$|\.)')
+
+# (error_type, clarification_question, suggestion) for any unparseable time
+_INVALID_TIME = ("invalid_time", "I didn't catch that time. Could you say '2 PM' or '14:00'?", "2 PM or 14:00")
+
+
+@lru_cache(maxsize=32)
+def _get_tz(name: str):
+    # pytz.timezone() reloads zoneinfo data on every call; validators are built per request
+    return pytz.timezone(name)
+
 class ValidationResult:
+    __slots__ = ('is_valid', 'error_type', 'clarification_question', 'suggestion')
+    
+    # Shared result for the success path; treat as read-only
+    _OK: 'ValidationResult' = None
+    
     def __init__(self, is_valid: bool, error_type: Optional[str] = None, clarification_question: Optional[str] = None, suggestion: Optional[str] = None):
         self.is_valid = is_valid
         self.error_type = error_type
         self.clarification_question = clarification_question
         self.suggestion = suggestion
+    
+    @classmethod
+    def ok(cls) -> 'ValidationResult':
+        return cls._OK
+
+ValidationResult._OK = ValidationResult(is_valid=True)
 
 class EdgeCaseValidator:
     MAX_REASONABLE_DURATION = 480
     LONG_DURATION_THRESHOLD = 240
     
-    def __init__(self, timezone: str = 'Asia/Kolkata'):
-        self.timezone = pytz.timezone(timezone)
-        self.now = datetime.now(self.timezone)
+    def __init__(self, timezone: str = 'Asia/Kolkata', now: Optional[datetime] = None):
+        self.timezone = _get_tz(timezone)
+        # Callers that already hold the current time for this request can pass it in
+        self.now = now.astimezone(self.timezone) if now is not None else datetime.now(self.timezone)
     
-    def validate_date(self, date_obj: datetime, date_string: str) -> ValidationResult:
+    def _check_date(self, date_obj: datetime, date_string: str) -> Optional[Tuple[str, str, Optional[str]]]:
         if not date_obj:
-            return ValidationResult(is_valid=True)
+            return None
         
         if date_obj.tzinfo is None:
             date_obj = self.timezone.localize(date_obj)
@@ -31,44 +71,35 @@ class EdgeCaseValidator:
         now_date = self.now.replace(hour=0, minute=0, second=0, microsecond=0)
         
         if date_only < now_date:
-            logger.warning(f"Past date detected: {date_obj.strftime('%A, %B %d, %Y')}")
+            if logger.isEnabledFor(logging.WARNING):
+                logger.warning("Past date detected: %s, %s %02d, %d", _WEEKDAY[date_obj.weekday()], _MONTH[date_obj.month], date_obj.day, date_obj.year)
             
             date_lower = date_string.lower()
-            explicit_past = any(word in date_lower for word in ['last', 'past', 'yesterday', 'previous'])
+            explicit_past = _PAST_RE.search(date_lower) is not None
             
             if explicit_past:
-                day_name = date_obj.strftime('%A')
+                day_name = _WEEKDAY[date_obj.weekday()]
                 
                 clarification = f"I can only schedule future events. Did you mean next {day_name}?"
                 suggestion = f"next {day_name.lower()}"
                 
-                logger.info(f"Suggesting correction: '{date_string}' → '{suggestion}'")
+                logger.info("Suggesting correction: '%s' → '%s'", date_string, suggestion)
                 
-                return ValidationResult(
-                    is_valid=False,
-                    error_type="past_date",
-                    clarification_question=clarification,
-                    suggestion=suggestion
-                )
+                return "past_date", clarification, suggestion
             else:
-                clarification = f"That date ({date_obj.strftime('%B %d')}) has already passed. Did you mean a future date?"
+                clarification = f"That date ({_MONTH[date_obj.month]} {date_obj.day:02d}) has already passed. Did you mean a future date?"
                 
-                return ValidationResult(
-                    is_valid=False,
-                    error_type="past_date",
-                    clarification_question=clarification,
-                    suggestion=None
-                )
-        
-        return ValidationResult(is_valid=True)
+                return "past_date", clarification, None
+        
+        return None
     
-    def validate_duration(self, duration_minutes: int, duration_string: str) -> ValidationResult:
+    def _check_duration(self, duration_minutes: int, duration_string: str) -> Optional[Tuple[str, str, Optional[str]]]:
         if not duration_minutes or duration_minutes <= 0:
-            return ValidationResult(is_valid=True)
+            return None
         
         if duration_minutes > self.MAX_REASONABLE_DURATION:
             hours = duration_minutes / 60
-            logger.warning(f"Unrealistic duration: {duration_minutes} minutes")
+            logger.warning("Unrealistic duration: %s minutes", duration_minutes)
             
             suggestion = None
             if duration_minutes == 600:
@@ -82,90 +113,78 @@ class EdgeCaseValidator:
             else:
                 clarification = f"{int(hours)} hours is quite long — did you mean {int(hours)} minutes or 1 hour?"
             
-            return ValidationResult(
-                is_valid=False,
-                error_type="unrealistic_duration",
-                clarification_question=clarification,
-                suggestion=suggestion
-            )
+            return "unrealistic_duration", clarification, suggestion
         
         elif duration_minutes >= self.LONG_DURATION_THRESHOLD:
             hours = duration_minutes / 60
             clarification = f"{int(hours)} hours is quite long. Is that correct?"
             
-            return ValidationResult(
-                is_valid=False,
-                error_type="long_duration",
-                clarification_question=clarification,
-                suggestion=None
-            )
-        
-        return ValidationResult(is_valid=True)
+            return "long_duration", clarification, None
+        
+        return None
     
-    def validate_time(self, time_string: str, message: str) -> ValidationResult:
+    def _check_time(self, time_string: str, message: str) -> Optional[Tuple[str, str, Optional[str]]]:
         if not message:
-            return ValidationResult(is_valid=True)
+            return None
         
         message_lower = message.lower()
         
-        invalid_patterns = [
-            (r'(\d+)\s*o[\'\']?\s*clock', lambda m: int(m.group(1)) > 24 or int(m.group(1)) == 0),
-            (r'(?<![:\d])(\d+)\s*(?:pm|am)(?!\d)', lambda m: int(m.group(1)) > 12 or int(m.group(1)) == 0),
-            (r'(\d+):(\d+)', lambda m: int(m.group(1)) >= 24 or int(m.group(2)) >= 60),
-        ]
-        
-        for pattern, validator in invalid_patterns:
-            match = re.search(pattern, message_lower)
+        for pattern, validator in _INVALID_TIME_PATTERNS:
+            match = pattern.search(message_lower)
             if match:
                 if validator(match):
                     invalid_time = match.group(0)
-                    logger.warning(f"Invalid time format: '{invalid_time}'")
-                    
-                    clarification = "I didn't catch that time. Could you say '2 PM' or '14:00'?"
+                    logger.warning("Invalid time format: '%s'", invalid_time)
                     
-                    return ValidationResult(
-                        is_valid=False,
-                        error_type="invalid_time",
-                        clarification_question=clarification,
-                        suggestion="2 PM or 14:00"
-                    )
+                    return _INVALID_TIME
         
         if not time_string:
-            time_indicators = ['at', 'around', 'about', 'approximately']
-            has_time_indicator = any(indicator in message_lower for indicator in time_indicators)
+            has_time_indicator = _TIME_INDICATOR_RE.search(message_lower) is not None
             
             if has_time_indicator:
-                number_match = re.search(r'(?:at|around|about)\s+(\d+)(?:\s|$|\.)', message_lower)
+                number_match = _TIME_REFERENCE_RE.search(message_lower)
                 if number_match:
                     number = int(number_match.group(1))
                     if number > 24 or number == 0:
-                        logger.warning(f"Invalid time reference: '{number}'")
+                        logger.warning("Invalid time reference: '%s'", number)
                         
-                        clarification = "I didn't catch that time. Could you say '2 PM' or '14:00'?"
-                        
-                        return ValidationResult(
-                            is_valid=False,
-                            error_type="invalid_time",
-                            clarification_question=clarification,
-                            suggestion="2 PM or 14:00"
-                        )
-        
-        return ValidationResult(is_valid=True)
+                        return _INVALID_TIME
+        
+        return None
+    
+    @staticmethod
+    def _to_result(failure: Optional[Tuple[str, str, Optional[str]]]) -> ValidationResult:
+        if failure is None:
+            return ValidationResult._OK
+        
+        error_type, clarification, suggestion = failure
+        return ValidationResult(
+            is_valid=False,
+            error_type=error_type,
+            clarification_question=clarification,
+            suggestion=suggestion
+        )
+    
+    def validate_date(self, date_obj: datetime, date_string: str) -> ValidationResult:
+        return self._to_result(self._check_date(date_obj, date_string))
+    
+    def validate_duration(self, duration_minutes: int, duration_string: str) -> ValidationResult:
+        return self._to_result(self._check_duration(duration_minutes, duration_string))
+    
+    def validate_time(self, time_string: str, message: str) -> ValidationResult:
+        return self._to_result(self._check_time(time_string, message))
     
     def validate_all(self, date_obj: Optional[datetime], date_string: str, duration_minutes: Optional[int], duration_string: str, time_string: Optional[str], message: str) -> Tuple[bool, Optional[str], Optional[str]]:
-        time_result = self.validate_time(time_string, message)
-        if not time_result.is_valid:
-            return False, time_result.error_type, time_result.clarification_question
+        # Runs the raw checks directly; ValidationResult objects are only built for the public validate_* methods
+        failure = self._check_time(time_string, message)
+        
+        if failure is None and date_obj:
+            failure = self._check_date(date_obj, date_string)
         
-        if date_obj:
-            date_result = self.validate_date(date_obj, date_string)
-            if not date_result.is_valid:
-                return False, date_result.error_type, date_result.clarification_question
+        if failure is None and duration_minutes:
+            failure = self._check_duration(duration_minutes, duration_string)
         
-        if duration_minutes:
-            duration_result = self.validate_duration(duration_minutes, duration_string)
-            if not duration_result.is_valid:
-                return False, duration_result.error_type, duration_result.clarification_question
+        if failure is not None:
+            return False, failure[0], failure[1]
         
         return True, None, None
-
@@ -1,7 +1,7 @@
 """Utility modules for the Smart Scheduler AI Agent."""
 
-from .config import settings
+from .config import settings, get_settings
 from .logger import logger, setup_logger
 
-__all__ = ["settings", "logger", "setup_logger"]
+__all__ = ["settings", "get_settings", "logger", "setup_logger"]
 
@@ -1,5 +1,6 @@
-from pydantic_settings import BaseSettings
+from pydantic_settings import BaseSettings, SettingsConfigDict
 from typing import Optional
+from functools import lru_cache
 
 class Settings(BaseSettings):
     deepgram_api_key: str
@@ -15,10 +16,26 @@ class Settings(BaseSettings):
     session_secret: str
     redis_url: Optional[str] = None
     default_timezone: str = "Asia/Kolkata"
+    debug_event_history: bool = True
+    deepgram_warm_pool_size: int = 2
+    executor_workers: int = 8
+    google_tts_cache_max_bytes: int = 10 * 1024 * 1024
+    google_tts_cache_ttl: int = 86400
+    google_tts_encoding: str = "LINEAR16"  # or OGG_OPUS
+    google_tts_qps: float = 15.0  # Default quota is 1000 requests/minute
+    google_tts_max_inflight: int = 8
+    metrics_port: Optional[int] = None  # Prometheus /metrics on its own port; off unless set
     
-    class Config:
-        env_file = ".env"
-        case_sensitive = False
+    model_config = SettingsConfigDict(
+        env_file=".env",
+        case_sensitive=False,
+        frozen=True,
+        extra="ignore"
+    )
 
-settings = Settings()
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    return Settings()
+
+settings = get_settings()
 
@@ -1,16 +1,24 @@
-from typing import Dict, Any, List, Callable
+from typing import Dict, Any, List, Callable, Deque, Optional
+from collections import deque
 import asyncio
-from datetime import datetime
 import json
 
-from .logger import logger
+from .logger import logger, utc_timestamp
 
 
 class DebugEventEmitter:
     def __init__(self):
         self.listeners: List[Callable] = []
-        self.event_history: List[Dict[str, Any]] = []
         self.max_history = 100
+        self.event_history: Deque[Dict[str, Any]] = deque(maxlen=self.max_history)
+        # Replayed to debug clients on connect; can be switched off at startup so
+        # production runs without a dashboard skip event construction entirely
+        self.history_enabled = True
+        # Events are queued synchronously and delivered by one long-lived dispatcher task,
+        # which flushes everything queued within a loop tick as a single batch
+        self._pending: Deque[Dict[str, Any]] = deque()
+        self._notify = asyncio.Event()
+        self._dispatcher: Optional[asyncio.Task] = None
     
     def add_listener(self, callback: Callable):
         self.listeners.append(callback)
@@ -19,73 +27,118 @@ class DebugEventEmitter:
         if callback in self.listeners:
             self.listeners.remove(callback)
     
-    async def emit(self, event_type: str, data: Dict[str, Any]):
+    def is_active(self) -> bool:
+        return self.history_enabled or bool(self.listeners)
+    
+    def enqueue(self, event_type: str, data: Dict[str, Any]):
         event = {
             "type": event_type,
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": utc_timestamp(),
             "data": data
         }
         
-        self.event_history.append(event)
-        if len(self.event_history) > self.max_history:
-            self.event_history.pop(0)
+        if self.history_enabled:
+            self.event_history.append(event)
+        
+        if not self.listeners:
+            return
         
-        for listener in self.listeners:
-            try:
-                if asyncio.iscoroutinefunction(listener):
-                    await listener(event)
-                else:
-                    listener(event)
-            except Exception as e:
-                logger.error(f"Error in debug event listener: {e}")
+        self._pending.append(event)
+        if not self._notify.is_set():
+            self._notify.set()
+        if self._dispatcher is None or self._dispatcher.done():
+            self._dispatcher = asyncio.get_running_loop().create_task(self._run_dispatcher())
+    
+    async def emit(self, event_type: str, data: Dict[str, Any]):
+        self.enqueue(event_type, data)
+    
+    async def _run_dispatcher(self):
+        while True:
+            await self._notify.wait()
+            # Yield once so the rest of the node transition (enter/routing/exit) lands in the same batch
+            await asyncio.sleep(0)
+            self._notify.clear()
+            
+            batch = []
+            while self._pending:
+                batch.append(self._pending.popleft())
+            
+            if batch:
+                await asyncio.gather(*[self._dispatch(listener, batch) for listener in list(self.listeners)])
+    
+    async def _dispatch(self, listener: Callable, batch: List[Dict[str, Any]]):
+        try:
+            if asyncio.iscoroutinefunction(listener):
+                await listener(batch)
+            else:
+                listener(batch)
+        except Exception as e:
+            logger.error("Error in debug event listener: %s", e)
     
     def get_history(self) -> List[Dict[str, Any]]:
-        return self.event_history.copy()
+        return list(self.event_history)
 
 
 debug_emitter = DebugEventEmitter()
 
 
-def emit_node_enter(node_name: str, state: Dict[str, Any]):
+_SUMMARY_FIELDS = (
+    "duration", "date", "original_requested_date", "time",
+    "messages_count", "slots_count", "ready_to_book", "confirmed"
+)
+
+_last_summary_key = None
+_last_summary: Optional[Dict[str, Any]] = None
+
+
+def _summary(state: Dict[str, Any]) -> Dict[str, Any]:
+    # Enter/exit of the same node usually see an unchanged state, so the summary dict is reused
+    global _last_summary_key, _last_summary
+    
     messages = state.get("messages") or []
     slots = state.get("available_slots") or []
+    key = (
+        state.get("meeting_duration_minutes"),
+        state.get("preferred_date"),
+        state.get("original_requested_date"),
+        state.get("time_preference"),
+        len(messages),
+        len(slots),
+        state.get("ready_to_book"),
+        state.get("confirmed")
+    )
     
-    asyncio.create_task(debug_emitter.emit("node_enter", {
+    if key != _last_summary_key:
+        _last_summary_key = key
+        _last_summary = dict(zip(_SUMMARY_FIELDS, key))
+    return _last_summary
+
+
+def emit_node_enter(node_name: str, state: Dict[str, Any]):
+    if not debug_emitter.is_active():
+        return
+    
+    debug_emitter.enqueue("node_enter", {
         "node": node_name,
-        "state_summary": {
-            "duration": state.get("meeting_duration_minutes"),
-            "date": state.get("preferred_date"),
-            "original_requested_date": state.get("original_requested_date"),
-            "time": state.get("time_preference"),
-            "messages_count": len(messages),
-            "slots_count": len(slots),
-            "ready_to_book": state.get("ready_to_book"),
-            "confirmed": state.get("confirmed")
-        }
-    }))
+        "state_summary": _summary(state)
+    })
 
 
 def emit_node_exit(node_name: str, state: Dict[str, Any]):
-    messages = state.get("messages") or []
-    slots = state.get("available_slots") or []
+    if not debug_emitter.is_active():
+        return
     
-    asyncio.create_task(debug_emitter.emit("node_exit", {
+    debug_emitter.enqueue("node_exit", {
         "node": node_name,
-        "state_summary": {
-            "duration": state.get("meeting_duration_minutes"),
-            "date": state.get("preferred_date"),
-            "original_requested_date": state.get("original_requested_date"),
-            "time": state.get("time_preference"),
-            "messages_count": len(messages),
-            "slots_count": len(slots),
-            "ready_to_book": state.get("ready_to_book"),
-            "confirmed": state.get("confirmed")
-        }
-    }))
+        "state_summary": _summary(state)
+    })
 
 
 def emit_error(node_name: str, error: Exception, state: Dict[str, Any]):
-    asyncio.create_task(debug_emitter.emit("error", {
+    if not debug_emitter.is_active():
+        return
+    
+    debug_emitter.enqueue("error", {
         "node": node_name,
         "error_type": type(error).__name__,
         "error_message": str(error),
@@ -94,50 +147,71 @@ def emit_error(node_name: str, error: Exception, state: Dict[str, Any]):
             "date": state.get("preferred_date"),
             "time": state.get("time_preference"),
         }
-    }))
+    })
 
 
 def emit_routing(from_node: str, to_node: str, reason: str = ""):
-    asyncio.create_task(debug_emitter.emit("routing", {
+    if not debug_emitter.is_active():
+        return
+    
+    debug_emitter.enqueue("routing", {
         "from": from_node,
         "to": to_node,
         "reason": reason
-    }))
+    })
 
 
 def emit_message(role: str, content: str):
-    asyncio.create_task(debug_emitter.emit("message", {
+    if not debug_emitter.is_active():
+        return
+    
+    debug_emitter.enqueue("message", {
         "role": role,
         "content": content[:200]
-    }))
+    })
 
 
 def emit_calendar_query(query_details: dict):
-    asyncio.create_task(debug_emitter.emit("calendar_query", query_details))
+    if not debug_emitter.is_active():
+        return
+    
+    debug_emitter.enqueue("calendar_query", query_details)
 
 
 def emit_calendar_events(events: list):
-    asyncio.create_task(debug_emitter.emit("calendar_events", {
+    if not debug_emitter.is_active():
+        return
+    
+    debug_emitter.enqueue("calendar_events", {
         "count": len(events),
         "events": events
-    }))
+    })
 
 
 def emit_availability_check(check_details: dict):
-    asyncio.create_task(debug_emitter.emit("availability_check", check_details))
+    if not debug_emitter.is_active():
+        return
+    
+    debug_emitter.enqueue("availability_check", check_details)
 
 
 def emit_raw_calendar_data(source: str, data: any):
-    asyncio.create_task(debug_emitter.emit("raw_calendar_data", {
+    if not debug_emitter.is_active():
+        return
+    
+    debug_emitter.enqueue("raw_calendar_data", {
         "source": source,
         "data": data
-    }))
+    })
 
 
 def emit_deduction(source: str, reasoning: str, data: any = None):
-    asyncio.create_task(debug_emitter.emit("deduction", {
+    if not debug_emitter.is_active():
+        return
+    
+    debug_emitter.enqueue("deduction", {
         "source": source,
         "reasoning": reasoning,
         "data": data
-    }))
+    })
 
@@ -1,13 +1,26 @@
 import logging
 import sys
 from typing import Any
-import json
-from datetime import datetime
+import orjson
+import time
+from datetime import datetime, timezone
+
+_last_ts_ms = 0
+_last_ts_str = ""
+
+def utc_timestamp() -> str:
+    """UTC ISO-8601 timestamp at millisecond precision, reused for records in the same millisecond."""
+    global _last_ts_ms, _last_ts_str
+    ms = int(time.time() * 1000)
+    if ms != _last_ts_ms:
+        _last_ts_str = datetime.fromtimestamp(ms / 1000, tz=timezone.utc).replace(tzinfo=None).isoformat(timespec='milliseconds')
+        _last_ts_ms = ms
+    return _last_ts_str
 
 class JSONFormatter(logging.Formatter):
     def format(self, record: logging.LogRecord) -> str:
         log_data = {
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": utc_timestamp(),
             "level": record.levelname,
             "logger": record.name,
             "message": record.getMessage(),
@@ -19,7 +32,7 @@ class JSONFormatter(logging.Formatter):
         if record.exc_info:
             log_data["exception"] = self.formatException(record.exc_info)
         
-        return json.dumps(log_data)
+        return orjson.dumps(log_data).decode()
 
 def setup_logger(name: str, level: int = logging.INFO) -> logging.Logger:
     logger = logging.getLogger(name)
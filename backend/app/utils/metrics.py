@@ -0,0 +1,24 @@
+"""Prometheus metrics, served on settings.metrics_port when it is set."""
+
+from prometheus_client import Counter, Histogram
+
+_LATENCY_BUCKETS = (.05, .1, .2, .5, 1, 2, 5)
+
+TTS_SYNTH_SECONDS = Histogram(
+    "tts_synth_seconds",
+    "Google TTS synthesize_speech latency in seconds",
+    buckets=_LATENCY_BUCKETS
+)
+TTS_STREAM_FIRST_CHUNK_SECONDS = Histogram(
+    "tts_stream_first_chunk_seconds",
+    "Google TTS StreamingSynthesize time to first audio chunk in seconds",
+    buckets=_LATENCY_BUCKETS
+)
+TTS_STREAM_SECONDS = Histogram(
+    "tts_stream_seconds",
+    "Google TTS StreamingSynthesize total stream duration in seconds",
+    buckets=(.2, .5, 1, 2, 5, 10, 30)
+)
+TTS_CACHE_HITS = Counter("tts_cache_hits_total", "Google TTS requests served from cache")
+TTS_CACHE_MISSES = Counter("tts_cache_misses_total", "Google TTS requests not served from cache")
+TTS_BYTES_RETURNED = Counter("tts_bytes_returned_total", "Audio bytes returned or streamed by Google TTS")
@@ -10,10 +10,240 @@ All times are handled in IST (Indian Standard Time).
 """
 
 import re
+from functools import lru_cache
 from typing import Optional, Dict, Tuple
 from datetime import datetime, time
 import pytz
 
+# The three accepted shapes, tried in order within a single match:
+# 12-hour with AM/PM, 24-hour HH:MM, bare hour
+_TIME_MASTER_RE = re.compile(
+    r'(\d{1,2}):?(\d{2})?\s*(AM|PM)'
+    r'|(\d{1,2}):(\d{2})'
+    r'|(\d{1,2})'
+)
+
+_HHMM_RE = re.compile(r'(\d{1,2}):(\d{2})')
+
+# Time mentions inside free-form messages, tried in order
+_EXTRACT_PATTERNS = (
+    re.compile(r'(\d{1,2}:?\d{0,2}\s*(?:AM|PM|am|pm))', re.IGNORECASE),
+    re.compile(r'(\d{1,2}:\d{2})', re.IGNORECASE),
+    re.compile(r'(\d{1,2})\s*(?:o\'clock|oclock)', re.IGNORECASE)
+)
+
+# Context hints, matched as plain substrings (so "3pm" still counts as PM)
+_PM_CONTEXT_RE = re.compile(r'afternoon|pm|evening|night')
+_AM_CONTEXT_RE = re.compile(r'morning|am')
+
+def _fast_parse(time_str: str) -> Optional[Tuple[int, Optional[int], Optional[str]]]:
+    """
+    Hand-rolled scan of the common H[H][:MM][ AM|PM] shape.
+    
+    Returns (hour, minute or None, "AM"/"PM" or None) only when the whole string
+    is consumed, otherwise None so the caller falls back to _TIME_MASTER_RE.
+    """
+    n = len(time_str)
+    if n == 0 or not time_str[0].isdecimal():
+        return None
+    
+    i = 2 if n > 1 and time_str[1].isdecimal() else 1
+    hour = int(time_str[:i])
+    minute = None
+    
+    if i < n and time_str[i] == ':':
+        if i + 3 > n or not time_str[i + 1:i + 3].isdecimal():
+            return None
+        minute = int(time_str[i + 1:i + 3])
+        i += 3
+    
+    while i < n and time_str[i] == ' ':
+        i += 1
+    
+    if i == n:
+        return hour, minute, None
+    
+    am_pm = time_str[i:i + 2]
+    if i + 2 == n and am_pm in ("AM", "PM"):
+        return hour, minute, am_pm
+    
+    return None
+
+# Pure string transforms behind the TimeFormat static methods, memoized because the
+# same handful of times ("3 PM", "15:00", ...) recur throughout a conversation
+
+@lru_cache(maxsize=512)
+def _parse_to_24hr(time_str: str, context: Optional[str] = None) -> Optional[str]:
+    if not time_str:
+        return None
+    
+    time_str = str(time_str).strip().upper()
+    
+    # Remove common words
+    time_str = time_str.replace("AT", "").replace("O'CLOCK", "").strip()
+    
+    parsed = _fast_parse(time_str)
+    if parsed is None:
+        match = _TIME_MASTER_RE.match(time_str)
+        if not match:
+            return None
+        
+        if match.group(3):
+            parsed = (int(match.group(1)), int(match.group(2)) if match.group(2) else None, match.group(3))
+        elif match.group(5):
+            parsed = (int(match.group(4)), int(match.group(5)), None)
+        else:
+            parsed = (int(match.group(6)), None, None)
+    
+    hour, minute, am_pm = parsed
+    
+    # Pattern 1: 12-hour with AM/PM (3 PM, 3:30 PM, 03:30 PM)
+    if am_pm:
+        minute = minute or 0
+        
+        # Validate
+        if hour < 1 or hour > 12 or minute < 0 or minute >= 60:
+            return None
+        
+        # Convert to 24-hour
+        if am_pm == 'PM' and hour != 12:
+            hour += 12
+        elif am_pm == 'AM' and hour == 12:
+            hour = 0
+        
+        return f"{hour:02d}:{minute:02d}"
+    
+    # Pattern 2: 24-hour format (15:00, 3:00)
+    if minute is not None:
+        # Validate
+        if hour < 0 or hour >= 24 or minute < 0 or minute >= 60:
+            return None
+        
+        # If hour >= 12, it's clearly 24-hour format
+        if hour >= 12:
+            return f"{hour:02d}:{minute:02d}"
+        
+        # Ambiguous (0-11) - use context
+        if context:
+            context_lower = context.lower()
+            if _PM_CONTEXT_RE.search(context_lower):
+                # User meant PM
+                if hour != 12:
+                    hour += 12
+                return f"{hour:02d}:{minute:02d}"
+            elif _AM_CONTEXT_RE.search(context_lower):
+                # User meant AM
+                return f"{hour:02d}:{minute:02d}"
+        
+        # Default: business hours logic (9 AM - 5 PM is common)
+        # If hour is 9-11, assume AM
+        # If hour is 1-5, assume PM
+        # Otherwise, return as-is
+        if 1 <= hour <= 5:
+            hour += 12  # Assume PM for 1-5
+        
+        return f"{hour:02d}:{minute:02d}"
+    
+    # Pattern 3: Just hour (3, 15)
+    if hour < 0 or hour >= 24:
+        return None
+    
+    # If clearly 24-hour (13-23)
+    if hour >= 13:
+        return f"{hour:02d}:00"
+    
+    # Use context for ambiguous hours
+    if context:
+        context_lower = context.lower()
+        if _PM_CONTEXT_RE.search(context_lower):
+            if hour != 12:
+                hour += 12
+            return f"{hour:02d}:00"
+    
+    # Default for common times
+    if 1 <= hour <= 5:
+        hour += 12  # Assume PM
+    
+    return f"{hour:02d}:00"
+
+@lru_cache(maxsize=512)
+def _to_12hr_display(time_24hr: str) -> str:
+    if not time_24hr:
+        return ""
+    
+    try:
+        match = _HHMM_RE.match(time_24hr)
+        if not match:
+            return time_24hr
+        
+        hour = int(match.group(1))
+        minute = int(match.group(2))
+        
+        # Determine AM/PM
+        am_pm = "AM" if hour < 12 else "PM"
+        
+        # Convert to 12-hour
+        hour_12 = hour % 12
+        if hour_12 == 0:
+            hour_12 = 12
+        
+        # Format display (hide :00 for cleaner look)
+        if minute == 0:
+            return f"{hour_12} {am_pm}"
+        else:
+            return f"{hour_12}:{minute:02d} {am_pm}"
+    
+    except:
+        return time_24hr
+
+@lru_cache(maxsize=512)
+def _to_12hr_full(time_24hr: str) -> str:
+    if not time_24hr:
+        return ""
+    
+    try:
+        match = _HHMM_RE.match(time_24hr)
+        if not match:
+            return time_24hr
+        
+        hour = int(match.group(1))
+        minute = int(match.group(2))
+        
+        am_pm = "AM" if hour < 12 else "PM"
+        hour_12 = hour % 12
+        if hour_12 == 0:
+            hour_12 = 12
+        
+        return f"{hour_12:02d}:{minute:02d} {am_pm}"
+    
+    except:
+        return time_24hr
+
+@lru_cache(maxsize=512)
+def _is_business_hours(time_24hr: str) -> bool:
+    try:
+        hour = int(time_24hr.split(':')[0])
+        return 9 <= hour < 18
+    except:
+        return False
+
+@lru_cache(maxsize=512)
+def _get_time_of_day(time_24hr: str) -> str:
+    try:
+        hour = int(time_24hr.split(':')[0])
+        
+        if 5 <= hour < 12:
+            return "morning"
+        elif 12 <= hour < 17:
+            return "afternoon"
+        elif 17 <= hour < 21:
+            return "evening"
+        else:
+            return "night"
+    except:
+        return "unknown"
+
+
 class TimeFormat:
     """
     Utility class for time format conversions and validation.
@@ -38,95 +268,7 @@ class TimeFormat:
         Returns:
             24-hour format string (HH:MM) or None if unparseable
         """
-        if not time_str:
-            return None
-        
-        time_str = str(time_str).strip().upper()
-        
-        # Remove common words
-        time_str = time_str.replace("AT", "").replace("O'CLOCK", "").strip()
-        
-        # Pattern 1: 12-hour with AM/PM (3 PM, 3:30 PM, 03:30 PM)
-        match = re.match(r'(\d{1,2}):?(\d{2})?\s*(AM|PM)', time_str)
-        if match:
-            hour = int(match.group(1))
-            minute = int(match.group(2)) if match.group(2) else 0
-            am_pm = match.group(3)
-            
-            # Validate
-            if hour < 1 or hour > 12 or minute < 0 or minute >= 60:
-                return None
-            
-            # Convert to 24-hour
-            if am_pm == 'PM' and hour != 12:
-                hour += 12
-            elif am_pm == 'AM' and hour == 12:
-                hour = 0
-            
-            return f"{hour:02d}:{minute:02d}"
-        
-        # Pattern 2: 24-hour format (15:00, 3:00)
-        match = re.match(r'(\d{1,2}):(\d{2})', time_str)
-        if match:
-            hour = int(match.group(1))
-            minute = int(match.group(2))
-            
-            # Validate
-            if hour < 0 or hour >= 24 or minute < 0 or minute >= 60:
-                return None
-            
-            # If hour >= 12, it's clearly 24-hour format
-            if hour >= 12:
-                return f"{hour:02d}:{minute:02d}"
-            
-            # Ambiguous (0-11) - use context
-            if context:
-                context_lower = context.lower()
-                if any(word in context_lower for word in ['afternoon', 'pm', 'evening', 'night']):
-                    # User meant PM
-                    if hour != 12:
-                        hour += 12
-                    return f"{hour:02d}:{minute:02d}"
-                elif any(word in context_lower for word in ['morning', 'am']):
-                    # User meant AM
-                    return f"{hour:02d}:{minute:02d}"
-            
-            # Default: business hours logic (9 AM - 5 PM is common)
-            # If hour is 9-11, assume AM
-            # If hour is 1-5, assume PM
-            # Otherwise, return as-is
-            if 1 <= hour <= 5:
-                hour += 12  # Assume PM for 1-5
-            
-            return f"{hour:02d}:{minute:02d}"
-        
-        # Pattern 3: Just hour (3, 15)
-        match = re.match(r'(\d{1,2})', time_str)
-        if match:
-            hour = int(match.group(1))
-            
-            if hour < 0 or hour >= 24:
-                return None
-            
-            # If clearly 24-hour (13-23)
-            if hour >= 13:
-                return f"{hour:02d}:00"
-            
-            # Use context for ambiguous hours
-            if context:
-                context_lower = context.lower()
-                if any(word in context_lower for word in ['afternoon', 'pm', 'evening', 'night']):
-                    if hour != 12:
-                        hour += 12
-                    return f"{hour:02d}:00"
-            
-            # Default for common times
-            if 1 <= hour <= 5:
-                hour += 12  # Assume PM
-            
-            return f"{hour:02d}:00"
-        
-        return None
+        return _parse_to_24hr(time_str, context)
     
     @staticmethod
     def to_12hr_display(time_24hr: str) -> str:
@@ -145,33 +287,7 @@ class TimeFormat:
             "09:00" → "9 AM"
             "09:15" → "9:15 AM"
         """
-        if not time_24hr:
-            return ""
-        
-        try:
-            match = re.match(r'(\d{1,2}):(\d{2})', time_24hr)
-            if not match:
-                return time_24hr
-            
-            hour = int(match.group(1))
-            minute = int(match.group(2))
-            
-            # Determine AM/PM
-            am_pm = "AM" if hour < 12 else "PM"
-            
-            # Convert to 12-hour
-            hour_12 = hour % 12
-            if hour_12 == 0:
-                hour_12 = 12
-            
-            # Format display (hide :00 for cleaner look)
-            if minute == 0:
-                return f"{hour_12} {am_pm}"
-            else:
-                return f"{hour_12}:{minute:02d} {am_pm}"
-        
-        except:
-            return time_24hr
+        return _to_12hr_display(time_24hr)
     
     @staticmethod
     def to_12hr_full(time_24hr: str) -> str:
@@ -188,26 +304,7 @@ class TimeFormat:
             "15:00" → "03:00 PM"
             "09:00" → "09:00 AM"
         """
-        if not time_24hr:
-            return ""
-        
-        try:
-            match = re.match(r'(\d{1,2}):(\d{2})', time_24hr)
-            if not match:
-                return time_24hr
-            
-            hour = int(match.group(1))
-            minute = int(match.group(2))
-            
-            am_pm = "AM" if hour < 12 else "PM"
-            hour_12 = hour % 12
-            if hour_12 == 0:
-                hour_12 = 12
-            
-            return f"{hour_12:02d}:{minute:02d} {am_pm}"
-        
-        except:
-            return time_24hr
+        return _to_12hr_full(time_24hr)
     
     @staticmethod
     def validate_and_correct(time_str: str, context: Optional[str] = None) -> Tuple[str, bool]:
@@ -238,13 +335,13 @@ class TimeFormat:
             hour = int(parsed.split(':')[0])
             
             # Check for PM context but AM time
-            if any(word in context_lower for word in ['afternoon', 'evening', 'night', 'pm']):
+            if _PM_CONTEXT_RE.search(context_lower):
                 if hour < 12:
                     # This looks like an error - should be PM
                     was_corrected = True
             
             # Check for AM context but PM time
-            elif any(word in context_lower for word in ['morning', 'am']):
+            elif _AM_CONTEXT_RE.search(context_lower):
                 if hour >= 12:
                     # This looks like an error - should be AM
                     was_corrected = True
@@ -266,14 +363,8 @@ class TimeFormat:
             "I want 3 PM" → {"24hr": "15:00", "12hr": "3 PM", "original": "3 PM"}
         """
         # Look for time patterns in message
-        patterns = [
-            r'(\d{1,2}:?\d{0,2}\s*(?:AM|PM|am|pm))',
-            r'(\d{1,2}:\d{2})',
-            r'(\d{1,2})\s*(?:o\'clock|oclock)'
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, message, re.IGNORECASE)
+        for pattern in _EXTRACT_PATTERNS:
+            match = pattern.search(message)
             if match:
                 original = match.group(1)
                 time_24hr = TimeFormat.parse_to_24hr(original, message)
@@ -298,11 +389,7 @@ class TimeFormat:
         Returns:
             True if within business hours
         """
-        try:
-            hour = int(time_24hr.split(':')[0])
-            return 9 <= hour < 18
-        except:
-            return False
+        return _is_business_hours(time_24hr)
     
     @staticmethod
     def get_time_of_day(time_24hr: str) -> str:
@@ -315,19 +402,7 @@ class TimeFormat:
         Returns:
             "morning", "afternoon", or "evening"
         """
-        try:
-            hour = int(time_24hr.split(':')[0])
-            
-            if 5 <= hour < 12:
-                return "morning"
-            elif 12 <= hour < 17:
-                return "afternoon"
-            elif 17 <= hour < 21:
-                return "evening"
-            else:
-                return "night"
-        except:
-            return "unknown"
+        return _get_time_of_day(time_24hr)
 
 # Convenience functions for common use cases
 
@@ -1,5 +1,6 @@
 import logging
 import asyncio
+import orjson
 from typing import Optional
 from fastapi import WebSocket
 
@@ -9,11 +10,24 @@ class WebSocketLogHandler(logging.Handler):
         super().__init__()
         self.websocket = websocket
         self.loop = None
+        # Set once the socket is gone so later records skip formatting entirely
+        self.disabled = False
         
     def set_event_loop(self, loop):
         self.loop = loop
+    
+    def close(self):
+        self.disabled = True
+        super().close()
+    
+    def _on_send_done(self, future):
+        if future.cancelled() or future.exception() is not None:
+            self.disabled = True
         
     def emit(self, record):
+        if self.disabled or not self.loop or self.loop.is_closed():
+            return
+        
         try:
             log_message = self.format(record)
             
@@ -32,11 +46,11 @@ class WebSocketLogHandler(logging.Handler):
                 "message": log_message
             }
             
-            if self.loop and not self.loop.is_closed():
-                asyncio.run_coroutine_threadsafe(
-                    self.websocket.send_json(message_data),
-                    self.loop
-                )
+            future = asyncio.run_coroutine_threadsafe(
+                self.websocket.send_text(orjson.dumps(message_data).decode()),
+                self.loop
+            )
+            future.add_done_callback(self._on_send_done)
         except Exception:
             pass
 
@@ -60,4 +74,5 @@ def attach_websocket_logger(websocket: WebSocket, logger_name: str = "smart_sche
 def detach_websocket_logger(handler: WebSocketLogHandler, logger_name: str = "smart_scheduler"):
     logger = logging.getLogger(logger_name)
     logger.removeHandler(handler)
+    handler.close()
 
@@ -2,7 +2,7 @@
 
 from .deepgram_client import deepgram_manager, DeepgramSTTClient, DeepgramSTTManager
 from .deepgram_tts_client import deepgram_tts_manager, DeepgramTTSClient, DeepgramTTSManager
-from .tts_client import tts_manager, GoogleTTSClient, GoogleTTSManager
+from .tts_client import tts_manager, get_tts_manager, GoogleTTSClient, GoogleTTSManager
 
 __all__ = [
     "deepgram_manager",
@@ -12,6 +12,7 @@ __all__ = [
     "DeepgramTTSClient",
     "DeepgramTTSManager",
     "tts_manager",
+    "get_tts_manager",
     "GoogleTTSClient",
     "GoogleTTSManager"
 ]
@@ -1,22 +1,124 @@
 from deepgram import DeepgramClient, LiveTranscriptionEvents, LiveOptions, DeepgramClientOptions
-from typing import Callable, Optional
+from websockets.exceptions import ConnectionClosed
+from websockets.protocol import State
+from typing import Callable, Optional, Tuple
+from collections import deque
 import asyncio
-import threading
+import logging
+import socket
+import os
 import ssl
 import certifi
 import time
+import re
 
 from ..utils.config import settings
 from ..utils.logger import logger
 
+# Disconnect noise from the Deepgram websocket that should be treated as "connection lost", not an error
+_BENIGN_WS_ERR = re.compile(r"no close frame|WebSocketException|connection closed|_signal_exit|send\(\) failed", re.IGNORECASE)
+
+# Pooled connections idle longer than this are replaced rather than handed to a session
+_WARM_MAX_IDLE = 120.0
+# Entries older than this are recycled in the background, checked every _WARM_RECYCLE_INTERVAL,
+# so a session should never find an expired one
+_WARM_RECYCLE_AGE = 90.0
+_WARM_RECYCLE_INTERVAL = 15.0
+
+# Activity timestamps only feed multi-second health windows, so skip clock reads finer than this
+_TIMESTAMP_GRANULARITY = 0.25
+
+class _BenignWSFilter(logging.Filter):
+    def filter(self, record: logging.LogRecord) -> bool:
+        if _BENIGN_WS_ERR.search(record.getMessage()):
+            return False
+        if record.exc_info and record.exc_info[1] is not None and _BENIGN_WS_ERR.search(str(record.exc_info[1])):
+            return False
+        return True
+
+# Filters only run for records logged on their own logger, not ones propagated up from children
+_benign_ws_filter = _BenignWSFilter()
+logging.getLogger("websockets.client").addFilter(_benign_ws_filter)
+
+def _quiet_sdk_logger(connection):
+    # The LiveClient logs through its own deepgram.clients.live.v1.client logger (with its own StreamHandler).
+    # It's created by the SDK after verboselogs.install(), so it can't be fetched here at import time.
+    sdk_logger = getattr(connection, "logger", None)
+    if isinstance(sdk_logger, logging.Logger):
+        sdk_logger.addFilter(_benign_ws_filter)
+
+def _noop(*args):
+    pass
+
+def _make_dispatch(callback: Optional[Callable], event_loop: asyncio.AbstractEventLoop) -> Callable:
+    """Build a thread-safe trampoline that runs callback on event_loop."""
+    if callback is None:
+        return _noop
+    if asyncio.iscoroutinefunction(callback):
+        return lambda *args: asyncio.run_coroutine_threadsafe(callback(*args), event_loop)
+    return lambda *args: event_loop.call_soon_threadsafe(callback, *args)
+
+def _finish_quietly(connection):
+    try:
+        connection.finish()
+    except Exception as e:
+        logger.debug(f"Error finishing abandoned Deepgram connection: {e}")
+
+def _finish_abandoned(start: asyncio.Future, connection):
+    """Done-callback for a handshake whose caller was cancelled: close the connection if it opened."""
+    if start.cancelled() or start.exception() is not None or not start.result():
+        return
+    asyncio.get_running_loop().run_in_executor(None, _finish_quietly, connection)
+
+def _socket_closed(connection) -> bool:
+    """True once the SDK's websocket has left OPEN; the SDK raises no event for a clean server close."""
+    protocol = getattr(getattr(connection, "_socket", None), "protocol", None)
+    return protocol is not None and protocol.state is not State.OPEN
+
+def _tune_socket(connection) -> bool:
+    """Turn on TCP keepalive and NODELAY on the SDK's websocket; returns False if the socket isn't reachable."""
+    # SDK 3.x LiveClient keeps a websockets.sync ClientConnection in _socket
+    sock = getattr(getattr(connection, "_socket", None), "socket", None)
+    if sock is None:
+        return False
+    
+    try:
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+        if hasattr(socket, "TCP_KEEPIDLE"):
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, 15)
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPINTVL, 5)
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPCNT, 3)
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        return True
+    except OSError as e:
+        logger.debug(f"Could not tune Deepgram socket: {e}")
+        return False
+
+_ssl_configured = False
+
+def _configure_ssl():
+    global _ssl_configured
+    if _ssl_configured:
+        return
+    
+    ca_bundle = certifi.where()
+    os.environ['SSL_CERT_FILE'] = ca_bundle
+    os.environ['REQUESTS_CA_BUNDLE'] = ca_bundle
+    _ssl_configured = True
+    logger.info(f"SSL certificates configured: {ca_bundle}")
+
+_configure_ssl()
+
 class DeepgramSTTClient:
+    __slots__ = (
+        'api_key', 'client', 'connection', 'is_connected', 'event_loop', '_close_lock',
+        '_last_activity', '_last_audio_sent', '_connection_lost', '_activity_timeout',
+        '_tx_buf', '_tx_target', '_tx_max_delay', '_tx_flush_handle',
+        '_transcript_q', '_transcript_task',
+        '_emit_utterance_end', '_emit_speech_started', '_emit_error'
+    )
+    
     def __init__(self):
-        import os
-        
-        os.environ['SSL_CERT_FILE'] = certifi.where()
-        os.environ['REQUESTS_CA_BUNDLE'] = certifi.where()
-        logger.info(f"SSL certificates configured: {certifi.where()}")
-        
         self.api_key = settings.deepgram_api_key
         
         if not self.api_key or len(self.api_key.strip()) == 0:
@@ -26,7 +128,8 @@ class DeepgramSTTClient:
         logger.info(f"Deepgram API key loaded: {self.api_key[:10]}...")
         
         config = DeepgramClientOptions(
-            options={"keepalive": "true"},
+            # Make send() raise on a clean close instead of silently returning True
+            options={"keepalive": "true", "termination_exception_send": "true"},
             url="wss://api.deepgram.com"
         )
         
@@ -35,11 +138,20 @@ class DeepgramSTTClient:
             self.connection = None
             self.is_connected = False
             self.event_loop = None
-            self._close_lock = threading.Lock()
-            self._last_activity = time.time()
-            self._last_audio_sent = time.time()
+            self._close_lock = asyncio.Lock()  # Not bound to a loop until first use (3.10+)
+            self._last_activity = time.monotonic()
+            self._last_audio_sent = time.monotonic()
             self._connection_lost = False
             self._activity_timeout = 30.0  # 30 seconds without activity = dead connection
+            self._tx_buf = bytearray()
+            self._tx_target = 3200  # 100ms of 16kHz mono linear16
+            self._tx_max_delay = 0.05
+            self._tx_flush_handle: Optional[asyncio.TimerHandle] = None
+            self._transcript_q: Optional[asyncio.Queue] = None
+            self._transcript_task: Optional[asyncio.Task] = None
+            self._emit_utterance_end: Callable[[], None] = _noop
+            self._emit_speech_started: Callable[[], None] = _noop
+            self._emit_error: Callable[[str], None] = _noop
             logger.info("Initialized Deepgram STT client")
         except Exception as e:
             logger.error(f"Failed to initialize Deepgram client: {e}")
@@ -55,10 +167,19 @@ class DeepgramSTTClient:
         if self._connection_lost:
             return False
         
+        # Closes show up in the socket state or the Close handler, half-open sockets via TCP keepalive;
+        # the activity window below is only a backstop for anything neither of those catches
+        if _socket_closed(self.connection):
+            logger.warning("Deepgram websocket is no longer open")
+            self._connection_lost = True
+            self.is_connected = False
+            return False
+        
         # RELAXED HEALTH CHECK: Only check if connection is truly dead
         # Don't timeout based on transcript activity - some speech doesn't generate interim results
-        time_since_activity = time.time() - self._last_activity
-        time_since_audio = time.time() - self._last_audio_sent
+        now = time.monotonic()
+        time_since_activity = now - self._last_activity
+        time_since_audio = now - self._last_audio_sent
         
         # Only consider dead if:
         # 1. We've been sending audio actively (within last 2 seconds)
@@ -97,49 +218,39 @@ class DeepgramSTTClient:
             )
             
             self.connection = self.client.listen.live.v("1")
+            _quiet_sdk_logger(self.connection)
             event_loop = self.event_loop
             
+            # Transcripts arrive on the SDK thread; hand them to one consumer task on the loop
+            self._transcript_q = asyncio.Queue()
+            self.bind_callbacks(on_transcript, on_utterance_end, on_speech_started, on_error)
+            
             def handle_transcript(live_client_self, result, **kwargs):
                 """Handle transcript. Note: first param is LiveClient, not our class."""
                 try:
                     sentence = result.channel.alternatives[0].transcript
                     
                     if sentence:
-                        # Update activity timestamp - connection is alive
-                        self._last_activity = time.time()
+                        # Update activity timestamp - connection is alive (coarse: the health window is 60s)
+                        now = time.monotonic()
+                        if now - self._last_activity > _TIMESTAMP_GRANULARITY:
+                            self._last_activity = now
                         self._connection_lost = False
                         
                         is_final = result.is_final
                         logger.debug(f"Transcript: {sentence}")
-                        if asyncio.iscoroutinefunction(on_transcript):
-                            asyncio.run_coroutine_threadsafe(
-                                on_transcript(sentence, is_final),
-                                event_loop
-                            )
-                        else:
-                            on_transcript(sentence, is_final)
+                        event_loop.call_soon_threadsafe(self._transcript_q.put_nowait, (sentence, is_final))
                 
                 except Exception as e:
                     logger.error(f"Error processing transcript: {e}")
-                    if on_error and event_loop:
-                        if asyncio.iscoroutinefunction(on_error):
-                            asyncio.run_coroutine_threadsafe(
-                                on_error(str(e)),
-                                event_loop
-                            )
-                        else:
-                            on_error(str(e))
+                    self._emit_error(str(e))
             
             def handle_error(live_client_self, error, **kwargs):
                 """Handle Deepgram errors. Note: first param is LiveClient, not our class."""
                 error_str = str(error)
                 
                 # Mark connection as lost for WebSocket errors (but don't spam logs)
-                if ("no close frame received or sent" in error_str or 
-                    "WebSocketException" in error_str or
-                    "connection closed" in error_str.lower() or
-                    "_signal_exit" in error_str or
-                    "send() failed" in error_str):
+                if _BENIGN_WS_ERR.search(error_str):
                     
                     # Only log once per disconnect
                     if not self._connection_lost:
@@ -151,28 +262,20 @@ class DeepgramSTTClient:
                 logger.error(f"Deepgram error: {error}")
                 self._connection_lost = True
                 self.is_connected = False
-                
-                if on_error and event_loop:
-                    if asyncio.iscoroutinefunction(on_error):
-                        asyncio.run_coroutine_threadsafe(
-                            on_error(str(error)),
-                            event_loop
-                        )
-                    else:
-                        on_error(str(error))
+                self._emit_error(str(error))
+            
+            def handle_close(live_client_self, close, **kwargs):
+                """Handle the socket closing. A clean (1000) close from Deepgram raises no Error event."""
+                if self.is_connected and not self._connection_lost:
+                    logger.warning("Deepgram closed the connection")
+                self._connection_lost = True
+                self.is_connected = False
             
             # NEW: Handle utterance end events
             def handle_utterance_end(result, **kwargs):
                 try:
                     logger.info("🎯 [DEEPGRAM] UtteranceEnd event - user stopped speaking")
-                    if on_utterance_end and event_loop:
-                        if asyncio.iscoroutinefunction(on_utterance_end):
-                            asyncio.run_coroutine_threadsafe(
-                                on_utterance_end(),
-                                event_loop
-                            )
-                        else:
-                            on_utterance_end()
+                    self._emit_utterance_end()
                 except Exception as e:
                     logger.error(f"Error handling utterance end: {e}")
             
@@ -180,14 +283,7 @@ class DeepgramSTTClient:
             def handle_speech_started(result, **kwargs):
                 try:
                     logger.info("🎤 [DEEPGRAM] SpeechStarted event - user started speaking")
-                    if on_speech_started and event_loop:
-                        if asyncio.iscoroutinefunction(on_speech_started):
-                            asyncio.run_coroutine_threadsafe(
-                                on_speech_started(),
-                                event_loop
-                            )
-                        else:
-                            on_speech_started()
+                    self._emit_speech_started()
                 except Exception as e:
                     logger.error(f"Error handling speech started: {e}")
             
@@ -196,15 +292,27 @@ class DeepgramSTTClient:
             self.connection.on(LiveTranscriptionEvents.UtteranceEnd, handle_utterance_end)
             self.connection.on(LiveTranscriptionEvents.SpeechStarted, handle_speech_started)
             self.connection.on(LiveTranscriptionEvents.Error, handle_error)
+            self.connection.on(LiveTranscriptionEvents.Close, handle_close)
             
             logger.info("Connecting to Deepgram...")
             try:
-                result = self.connection.start(options)
+                # start() does the websocket handshake synchronously; keep it off the event loop
+                start = asyncio.ensure_future(asyncio.to_thread(self.connection.start, options))
+                try:
+                    result = await asyncio.shield(start)
+                except asyncio.CancelledError:
+                    # Cancelling doesn't stop the handshake in its worker thread; close what it opens instead of leaking it
+                    start.add_done_callback(lambda f, connection=self.connection: _finish_abandoned(f, connection))
+                    self.connection = None
+                    self._cancel_transcript_task()
+                    raise
+                
                 if result:
                     self.is_connected = True
                     self._connection_lost = False
-                    self._last_activity = time.time()
-                    self._last_audio_sent = time.time()
+                    self._last_activity = time.monotonic()
+                    self._last_audio_sent = time.monotonic()
+                    _tune_socket(self.connection)
                     logger.info("Deepgram connection started")
                 else:
                     logger.error("Deepgram connection.start() returned False")
@@ -216,6 +324,7 @@ class DeepgramSTTClient:
         
         except Exception as e:
             logger.error(f"Error starting Deepgram transcription: {e}")
+            self._cancel_transcript_task()
             if on_error:
                 if asyncio.iscoroutinefunction(on_error):
                     try:
@@ -226,18 +335,94 @@ class DeepgramSTTClient:
                     on_error(str(e))
             raise
     
+    def bind_callbacks(
+        self,
+        on_transcript: Callable[[str, bool], None],
+        on_utterance_end: Optional[Callable[[], None]] = None,
+        on_speech_started: Optional[Callable[[], None]] = None,
+        on_error: Optional[Callable[[str], None]] = None
+    ):
+        """Point the event handlers at a new owner's callbacks (used when handing out a pre-warmed connection)."""
+        # Handlers run on the SDK thread; resolve sync vs async once here instead of per event
+        self._emit_utterance_end = _make_dispatch(on_utterance_end, self.event_loop)
+        self._emit_speech_started = _make_dispatch(on_speech_started, self.event_loop)
+        self._emit_error = _make_dispatch(on_error, self.event_loop)
+        
+        # A new owner starts a fresh activity window
+        self._last_activity = time.monotonic()
+        self._last_audio_sent = self._last_activity
+        
+        if self._transcript_q is not None:
+            self._cancel_transcript_task()
+            self._transcript_task = asyncio.create_task(self._drain_transcripts(on_transcript))
+    
+    async def _drain_transcripts(self, on_transcript: Callable[[str, bool], None]):
+        is_async = asyncio.iscoroutinefunction(on_transcript)
+        while True:
+            sentence, is_final = await self._transcript_q.get()
+            try:
+                if is_async:
+                    await on_transcript(sentence, is_final)
+                else:
+                    on_transcript(sentence, is_final)
+            except Exception as e:
+                logger.error(f"Error in transcript callback: {e}")
+    
+    def _cancel_transcript_task(self):
+        if self._transcript_task is not None:
+            self._transcript_task.cancel()
+            self._transcript_task = None
+    
     async def send_audio(self, audio_data: bytes):
         if not self.is_connected or not self.connection:
             logger.warning("Attempted to send audio while not connected")
             return
         
+        # Coalesce small mic frames into ~100ms websocket messages; a short timer ships any remainder
+        self._tx_buf.extend(audio_data)
+        if len(self._tx_buf) >= self._tx_target:
+            self._flush_audio()
+        elif self._tx_flush_handle is None:
+            self._tx_flush_handle = asyncio.get_running_loop().call_later(self._tx_max_delay, self._flush_audio_later)
+    
+    def _flush_audio_later(self):
+        self._tx_flush_handle = None
+        if not self.is_connected or not self.connection:
+            self._tx_buf.clear()
+            return
+        
+        try:
+            self._flush_audio()
+        except Exception:
+            pass  # Already logged and connection marked lost
+    
+    def _flush_audio(self):
+        if self._tx_flush_handle is not None:
+            self._tx_flush_handle.cancel()
+            self._tx_flush_handle = None
+        
+        if not self._tx_buf:
+            return
+        
+        audio_data = bytes(self._tx_buf)
+        self._tx_buf.clear()
+        
         try:
-            self.connection.send(audio_data)
-            # Update timestamp when audio is sent
-            self._last_audio_sent = time.time()
+            # The SDK returns False rather than raising once the socket has been closed
+            if not self.connection.send(audio_data):
+                if not self._connection_lost:
+                    logger.warning("Deepgram connection lost while sending: send() returned False")
+                self._connection_lost = True
+                self.is_connected = False
+                return
+            
+            # Update timestamp when audio is sent (coarse: the health window is 2s)
+            now = time.monotonic()
+            if now - self._last_audio_sent > _TIMESTAMP_GRANULARITY:
+                self._last_audio_sent = now
         except Exception as e:
             error_str = str(e)
-            if any(x in error_str for x in ["no close frame", "WebSocketException", "connection closed", "send() failed"]):
+            if isinstance(e, ConnectionClosed) or _BENIGN_WS_ERR.search(error_str):
                 if not self._connection_lost:
                     logger.warning(f"Deepgram connection lost while sending: {error_str[:100]}")
                 self._connection_lost = True
@@ -250,37 +435,113 @@ class DeepgramSTTClient:
             raise
     
     async def stop_transcription(self):
-        with self._close_lock:
+        async with self._close_lock:
             if not self.is_connected or not self.connection:
                 logger.debug("Connection already closed")
+                self._cancel_transcript_task()
                 return
             
+            try:
+                self._flush_audio()
+            except Exception:
+                pass
+            
             try:
                 self.is_connected = False
-                
-                import sys
-                import io
-                old_stderr = sys.stderr
-                sys.stderr = io.StringIO()
-                
-                try:
-                    await asyncio.to_thread(self.connection.finish)
-                    logger.info("Stopped Deepgram transcription")
-                finally:
-                    sys.stderr = old_stderr
-                    
+                await asyncio.to_thread(self.connection.finish)
+                logger.info("Stopped Deepgram transcription")
             except Exception as e:
                 error_str = str(e)
-                if not any(x in error_str for x in ["no close frame", "WebSocketException", "connection closed"]):
+                if not _BENIGN_WS_ERR.search(error_str):
                     logger.debug(f"Error stopping transcription: {e}")
             finally:
                 self.connection = None
+                self._cancel_transcript_task()
+
+def _ignore_transcript(sentence: str, is_final: bool):
+    pass
 
 class DeepgramSTTManager:
     def __init__(self):
         self.sessions = {}
+        # Connected-but-idle (client, pooled_at) pairs handed to new sessions to skip the websocket handshake
+        self._warm: "deque[Tuple[DeepgramSTTClient, float]]" = deque()
+        self._warm_pool_size = 0
+        self._refill_task: Optional[asyncio.Task] = None
+        self._recycle_task: Optional[asyncio.Task] = None
+        # Stale clients being closed off the request path (finish() sleeps and joins the SDK threads)
+        self._retiring = set()
         logger.info("Initialized Deepgram STT manager")
     
+    def start_warm_pool(self, size: int):
+        self._warm_pool_size = size
+        self._schedule_refill()
+        if size > 0 and self._recycle_task is None:
+            self._recycle_task = asyncio.create_task(self._recycle_warm_pool())
+    
+    async def close_warm_pool(self):
+        self._warm_pool_size = 0
+        for task in (self._refill_task, self._recycle_task):
+            if task is not None:
+                task.cancel()
+        self._refill_task = None
+        self._recycle_task = None
+        
+        while self._warm:
+            client, _ = self._warm.popleft()
+            self._retire(client)
+        
+        if self._retiring:
+            await asyncio.gather(*self._retiring, return_exceptions=True)
+    
+    def _retire(self, client: DeepgramSTTClient):
+        task = asyncio.create_task(self._stop_client("warm pool", client))
+        self._retiring.add(task)
+        task.add_done_callback(self._retiring.discard)
+    
+    async def _recycle_warm_pool(self):
+        while True:
+            await asyncio.sleep(_WARM_RECYCLE_INTERVAL)
+            now = time.monotonic()
+            fresh = deque()
+            for client, pooled_at in self._warm:
+                if client.is_healthy and now - pooled_at < _WARM_RECYCLE_AGE:
+                    fresh.append((client, pooled_at))
+                else:
+                    self._retire(client)
+            
+            if len(fresh) < len(self._warm):
+                logger.debug(f"Recycling {len(self._warm) - len(fresh)} pre-warmed Deepgram connection(s)")
+                self._warm = fresh
+                self._schedule_refill()
+    
+    def _schedule_refill(self):
+        if self._refill_task is None and len(self._warm) < self._warm_pool_size:
+            self._refill_task = asyncio.create_task(self._fill_warm_pool())
+    
+    async def _fill_warm_pool(self):
+        try:
+            while len(self._warm) < self._warm_pool_size:
+                client = DeepgramSTTClient()
+                await client.start_transcription(_ignore_transcript)
+                self._warm.append((client, time.monotonic()))
+            logger.debug(f"Deepgram warm pool ready ({len(self._warm)} connections)")
+        except Exception as e:
+            logger.warning(f"Could not pre-warm Deepgram connection: {e}")
+        finally:
+            self._refill_task = None
+    
+    def _take_warm_client(self) -> Optional[DeepgramSTTClient]:
+        while self._warm:
+            client, pooled_at = self._warm.popleft()
+            # is_healthy sees Deepgram closing an idle socket; the age cap covers closes we never heard about
+            if client.is_healthy and time.monotonic() - pooled_at < _WARM_MAX_IDLE:
+                return client
+            # Never make the session wait on closing it
+            logger.debug("Discarding stale pre-warmed Deepgram connection")
+            self._retire(client)
+        return None
+    
     async def create_session(
         self,
         session_id: str,
@@ -289,30 +550,46 @@ class DeepgramSTTManager:
         on_speech_started: Optional[Callable[[], None]] = None,
         on_error: Optional[Callable[[str], None]] = None
     ) -> DeepgramSTTClient:
-        if session_id in self.sessions:
+        previous = self.sessions.pop(session_id, None)
+        if previous is not None:
             logger.info(f"Session {session_id} already exists - cleaning up before reconnect")
-            await self.end_session(session_id)
+            await self._stop_client(session_id, previous)
         
-        client = DeepgramSTTClient()
-        await client.start_transcription(
-            on_transcript,
-            on_utterance_end,
-            on_speech_started,
-            on_error
-        )
+        client = self._take_warm_client()
+        if client is not None:
+            client.bind_callbacks(on_transcript, on_utterance_end, on_speech_started, on_error)
+            logger.info(f"Using pre-warmed Deepgram connection for {session_id}")
+        else:
+            client = DeepgramSTTClient()
+            await client.start_transcription(
+                on_transcript,
+                on_utterance_end,
+                on_speech_started,
+                on_error
+            )
+        self._schedule_refill()
+        
+        # Check-and-swap with no await in between, so a concurrent create for the same id can't leak its client
+        previous = self.sessions.get(session_id)
         self.sessions[session_id] = client
+        if previous is not None:
+            logger.info(f"Session {session_id} was recreated concurrently - closing the older connection")
+            await self._stop_client(session_id, previous)
+        
         logger.info(f"Created session: {session_id}")
         return client
     
     async def end_session(self, session_id: str):
-        if session_id in self.sessions:
-            try:
-                await self.sessions[session_id].stop_transcription()
-            except Exception as e:
-                logger.debug(f"Error stopping session {session_id}: {e}")
-            finally:
-                del self.sessions[session_id]
-                logger.info(f"Ended session: {session_id}")
+        client = self.sessions.pop(session_id, None)
+        if client is not None:
+            await self._stop_client(session_id, client)
+            logger.info(f"Ended session: {session_id}")
+    
+    async def _stop_client(self, session_id: str, client: DeepgramSTTClient):
+        try:
+            await client.stop_transcription()
+        except Exception as e:
+            logger.debug(f"Error stopping session {session_id}: {e}")
     
     def get_session(self, session_id: str) -> Optional[DeepgramSTTClient]:
         return self.sessions.get(session_id)
@@ -1,11 +1,18 @@
 from deepgram import DeepgramClient, SpeakOptions
-from typing import Optional, AsyncIterator
+from typing import Optional, AsyncIterator, Dict, Iterable, Tuple
+from collections import OrderedDict
+from functools import lru_cache
 import asyncio
+import hashlib
 import httpx
 
 from ..utils.config import settings
 from ..utils.logger import logger
 
+@lru_cache(maxsize=8)
+def _url_for(model: str, encoding: str, sample_rate: int, container: str) -> str:
+    return f"https://api.deepgram.com/v1/speak?model={model}&encoding={encoding}&sample_rate={sample_rate}&container={container}"
+
 class DeepgramTTSClient:
     def __init__(self):
         self.api_key = settings.deepgram_api_key
@@ -17,58 +24,49 @@ class DeepgramTTSClient:
             sample_rate=16000,
             container="none"
         )
+        self._base_url = self._url_for_options(self.default_options)
+        self._headers = {
+            "Authorization": f"Token {self.api_key}",
+            "Content-Type": "application/json"
+        }
+        
+        # Shared pooled client so repeat syntheses reuse the TLS connection to api.deepgram.com
+        # (longer read timeout for TTS to prevent hangs)
+        self._http = httpx.AsyncClient(
+            timeout=httpx.Timeout(60.0, connect=10.0),
+            limits=httpx.Limits(max_keepalive_connections=8, max_connections=16),
+            http2=True
+        )
         
         logger.info("Initialized Deepgram TTS client")
     
     async def synthesize_streaming(self, text: str, voice_model: Optional[str] = None) -> AsyncIterator[bytes]:
         try:
-            options = self.default_options
-            if voice_model:
-                options = SpeakOptions(
-                    model=voice_model,
-                    encoding="linear16",
-                    sample_rate=16000,
-                    container="none"
-                )
-            
             logger.debug(f"Streaming TTS: {text[:50]}...")
             
-            response = self.client.speak.v("1").stream(
-                {"text": text},
-                options
-            )
+            payload = {"text": text}
             
-            # Use longer timeout for TTS to prevent hangs
-            async with httpx.AsyncClient(timeout=httpx.Timeout(60.0, connect=10.0)) as http_client:
-                headers = {
-                    "Authorization": f"Token {self.api_key}",
-                    "Content-Type": "application/json"
-                }
-                
-                payload = {"text": text}
+            url = _url_for(voice_model, "linear16", 16000, "none") if voice_model else self._base_url
+            
+            async with self._http.stream(
+                "POST",
+                url,
+                headers=self._headers,
+                json=payload,
+            ) as response:
+                response.raise_for_status()
                 
-                url = f"https://api.deepgram.com/v1/speak?model={options.model}&encoding={options.encoding}&sample_rate={options.sample_rate}&container={options.container}"
+                chunk_count = 0
+                # 16384 bytes = 8192 samples = 512ms at 16kHz (still quick to first audio, 4x fewer iterations)
+                async for chunk in response.aiter_bytes(chunk_size=16384):
+                    if chunk and len(chunk) > 0:
+                        chunk_count += 1
+                        if chunk_count == 1:
+                            logger.debug("First audio chunk received")
+                        
+                        yield chunk
                 
-                async with http_client.stream(
-                    "POST",
-                    url,
-                    headers=headers,
-                    json=payload,
-                ) as response:
-                    response.raise_for_status()
-                    
-                    chunk_count = 0
-                    # Smaller chunks for lower latency and smoother playback
-                    # 4096 bytes = 2048 samples = 128ms at 16kHz (optimal for streaming)
-                    async for chunk in response.aiter_bytes(chunk_size=4096):
-                        if chunk and len(chunk) > 0:
-                            chunk_count += 1
-                            if chunk_count == 1:
-                                logger.debug("First audio chunk received")
-                            
-                            yield chunk
-                    
-                    logger.debug(f"Completed streaming {chunk_count} chunks")
+                logger.debug(f"Completed streaming {chunk_count} chunks")
         
         except httpx.TimeoutException as e:
             logger.error(f"TTS request timeout: {e}")
@@ -106,6 +104,17 @@ class DeepgramTTSClient:
             logger.error(f"Error in synchronous TTS: {e}")
             raise
     
+    async def synthesize_async(self, text: str, voice_model: Optional[str] = None) -> bytes:
+        # The SDK save() call blocks for the whole request; use this instead of synthesize_sync from async code
+        return await asyncio.to_thread(self.synthesize_sync, text, voice_model)
+    
+    async def aclose(self):
+        await self._http.aclose()
+    
+    @staticmethod
+    def _url_for_options(options: SpeakOptions) -> str:
+        return _url_for(options.model, options.encoding, options.sample_rate, options.container)
+    
     def set_voice(self, voice_model: str):
         self.default_options = SpeakOptions(
             model=voice_model,
@@ -113,49 +122,129 @@ class DeepgramTTSClient:
             sample_rate=16000,
             container="none"
         )
+        self._base_url = self._url_for_options(self.default_options)
         logger.info(f"Changed voice to: {voice_model}")
 
 class DeepgramTTSManager:
-    def __init__(self):
+    def __init__(self, cache_max_entries: int = 256, cache_max_bytes: int = 32 * 1024 * 1024):
         self.client = DeepgramTTSClient()
-        self.cache = {}
+        # LRU of synthesized audio, bounded by entry count and total bytes
+        self.cache: "OrderedDict[bytes, bytes]" = OrderedDict()
+        self._cache_max = cache_max_entries
+        self._cache_max_bytes = cache_max_bytes
+        self._cache_bytes = 0
+        # Fixed phrases synthesized at startup; kept outside the LRU so they are never evicted
+        self._pinned: Dict[Tuple[Optional[str], str], bytes] = {}
         logger.info("Initialized Deepgram TTS manager")
     
+    @staticmethod
+    def _cache_key(text: str, voice_model: Optional[str]) -> bytes:
+        return hashlib.blake2b(f"{voice_model or 'default'}:{text}".encode(), digest_size=16).digest()
+    
+    def _cache_get(self, key: bytes) -> Optional[bytes]:
+        audio = self.cache.get(key)
+        if audio is not None:
+            self.cache.move_to_end(key)
+        return audio
+    
+    def _cache_put(self, key: bytes, audio: bytes):
+        previous = self.cache.pop(key, None)
+        if previous is not None:
+            self._cache_bytes -= len(previous)
+        
+        self.cache[key] = audio
+        self._cache_bytes += len(audio)
+        
+        while self.cache and (len(self.cache) > self._cache_max or self._cache_bytes > self._cache_max_bytes):
+            _, evicted = self.cache.popitem(last=False)
+            self._cache_bytes -= len(evicted)
+    
     async def synthesize_streaming(self, text: str, voice_model: Optional[str] = None) -> AsyncIterator[bytes]:
-        cache_key = f"{text}:{voice_model or 'default'}"
-        if len(text) < 50 and cache_key in self.cache:
+        pinned = self._pinned.get((voice_model, text))
+        if pinned is not None:
+            logger.debug("Using prewarmed audio")
+            yield pinned
+            return
+        
+        if len(text) >= 50:
+            async for chunk in self.client.synthesize_streaming(text, voice_model):
+                yield chunk
+            return
+        
+        cache_key = self._cache_key(text, voice_model)
+        cached = self._cache_get(cache_key)
+        if cached is not None:
             logger.debug("Using cached audio for short phrase")
-            yield self.cache[cache_key]
+            yield cached
             return
         
-        audio_chunks = []
+        buf = bytearray()
         async for chunk in self.client.synthesize_streaming(text, voice_model):
-            audio_chunks.append(chunk)
+            buf.extend(chunk)
             yield chunk
         
-        if len(text) < 50:
-            self.cache[cache_key] = b''.join(audio_chunks)
+        self._cache_put(cache_key, bytes(buf))
     
     def synthesize_sync(self, text: str, use_cache: bool = True, voice_model: Optional[str] = None) -> bytes:
-        cache_key = f"{text}:{voice_model or 'default'}"
+        cache_key = self._cache_key(text, voice_model)
         
-        if use_cache and cache_key in self.cache:
-            logger.debug("Using cached audio")
-            return self.cache[cache_key]
+        if use_cache:
+            cached = self._cache_get(cache_key)
+            if cached is not None:
+                logger.debug("Using cached audio")
+                return cached
         
         audio = self.client.synthesize_sync(text, voice_model)
         
         if use_cache and len(text) < 100:
-            self.cache[cache_key] = audio
+            self._cache_put(cache_key, audio)
+        
+        return audio
+    
+    async def synthesize_async(self, text: str, use_cache: bool = True, voice_model: Optional[str] = None) -> bytes:
+        # Same as synthesize_sync, but only the request leaves the loop; the LRU is shared with
+        # synthesize_streaming and must only be touched from the event loop
+        cache_key = self._cache_key(text, voice_model)
+        
+        if use_cache:
+            cached = self._cache_get(cache_key)
+            if cached is not None:
+                logger.debug("Using cached audio")
+                return cached
+        
+        audio = await self.client.synthesize_async(text, voice_model)
+        
+        if use_cache and len(text) < 100:
+            self._cache_put(cache_key, audio)
         
         return audio
     
+    async def prewarm(self, phrases: Iterable[str], voice_model: Optional[str] = None):
+        phrases = list(phrases)
+        results = await asyncio.gather(
+            *(self._prewarm_one(text, voice_model) for text in phrases),
+            return_exceptions=True
+        )
+        failed = sum(1 for r in results if isinstance(r, Exception))
+        logger.info(f"Prewarmed TTS for {len(phrases) - failed}/{len(phrases)} phrases")
+    
+    async def _prewarm_one(self, text: str, voice_model: Optional[str]):
+        buf = bytearray()
+        async for chunk in self.client.synthesize_streaming(text, voice_model):
+            buf.extend(chunk)
+        self._pinned[(voice_model, text)] = bytes(buf)
+    
     def clear_cache(self):
         self.cache.clear()
+        self._cache_bytes = 0
         logger.info("Cleared TTS cache")
     
     def set_voice(self, voice_model: str):
         self.client.set_voice(voice_model)
+        self._pinned.clear()
+    
+    async def aclose(self):
+        await self.client.aclose()
 
 deepgram_tts_manager = DeepgramTTSManager()
 
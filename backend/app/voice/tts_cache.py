@@ -0,0 +1,42 @@
+from typing import Optional, Protocol
+
+try:
+    import redis.asyncio as redis
+except ImportError:
+    redis = None
+
+from ..utils.logger import logger
+
+class TTSCacheBackend(Protocol):
+    async def get(self, key: str) -> Optional[bytes]:
+        ...
+    
+    async def set(self, key: str, audio: bytes) -> None:
+        ...
+
+class RedisCache:
+    """Shared synthesized-audio cache that survives instance restarts and scale-to-zero."""
+    
+    def __init__(self, url: str, ttl: int = 86400, prefix: str = "tts:", timeout: float = 0.2):
+        if redis is None:
+            raise RuntimeError("redis package is not installed")
+        
+        # Short timeouts so an unreachable Redis costs a synthesis, not a multi-minute TCP stall
+        self._redis = redis.from_url(url, socket_connect_timeout=timeout, socket_timeout=timeout)
+        self._ttl = ttl
+        self._prefix = prefix
+        logger.info("Initialized Redis TTS cache")
+    
+    async def get(self, key: str) -> Optional[bytes]:
+        try:
+            return await self._redis.get(self._prefix + key)
+        except redis.RedisError as e:
+            # A cache outage should cost a synthesis, not fail the request
+            logger.warning(f"Redis TTS cache read failed: {e}")
+            return None
+    
+    async def set(self, key: str, audio: bytes) -> None:
+        try:
+            await self._redis.setex(self._prefix + key, self._ttl, audio)
+        except redis.RedisError as e:
+            logger.warning(f"Redis TTS cache write failed: {e}")
@@ -1,54 +1,276 @@
 from google.cloud import texttospeech
-from typing import Optional
+from google.cloud.texttospeech_v1.services.text_to_speech.transports import TextToSpeechGrpcAsyncIOTransport
+from google.api_core import exceptions as core_exceptions
+from google.api_core.retry_async import AsyncRetry, if_exception_type
+from aiolimiter import AsyncLimiter
+from typing import Optional, AsyncIterator, Awaitable, Callable, Dict, List, Tuple
+from collections import OrderedDict
+from functools import lru_cache
+from contextlib import asynccontextmanager
+import asyncio
 import base64
+import hashlib
+import os
+import re
+import struct
+import time
+import unicodedata
+import warnings
 
+from .tts_cache import TTSCacheBackend, RedisCache
 from ..utils.config import settings
+from ..utils.metrics import (
+    TTS_SYNTH_SECONDS, TTS_STREAM_FIRST_CHUNK_SECONDS, TTS_STREAM_SECONDS,
+    TTS_CACHE_HITS, TTS_CACHE_MISSES, TTS_BYTES_RETURNED
+)
 from ..utils.logger import logger
 
+# The API default deadline is 600s; a fallback voice line that slow is useless
+_RPC_TIMEOUT = 10.0
+
+# Streams are bounded per chunk rather than end to end, so a long reply isn't cut off mid-audio;
+# this is the longest wait allowed for the first chunk or between two chunks
+_STREAM_GAP_TIMEOUT = 10.0
+
+# Back off on quota/overload errors instead of hammering the API: 0.5s, 1s, 2s, 4s... within the RPC deadline
+_RPC_RETRY = AsyncRetry(
+    predicate=if_exception_type(core_exceptions.ResourceExhausted, core_exceptions.ServiceUnavailable),
+    initial=0.5,
+    maximum=4.0,
+    multiplier=2.0,
+    timeout=_RPC_TIMEOUT
+)
+
+# How long a request may wait for one of the google_tts_max_inflight slots before it is turned away
+_ADMISSION_TIMEOUT = 5.0
+
+# Long inputs are split on sentence ends and synthesized in parallel; latency grows with input length
+_SPLIT_THRESHOLD = 400
+_MAX_PIECE_CHARS = 500
+_SENTENCE_END_RE = re.compile(r'(?<=[.!?])\s+')
+_WAV_HEADER_LEN = 44
+
+def _split_sentences(text: str) -> List[str]:
+    """Pack whole sentences into pieces of at most _MAX_PIECE_CHARS (a longer single sentence stays whole)."""
+    pieces = []
+    current = ""
+    for sentence in _SENTENCE_END_RE.split(text):
+        if current and len(current) + 1 + len(sentence) > _MAX_PIECE_CHARS:
+            pieces.append(current)
+            current = sentence
+        else:
+            current = f"{current} {sentence}" if current else sentence
+    if current:
+        pieces.append(current)
+    return pieces
+
+def _join_audio(parts: List[bytes]) -> bytes:
+    """Concatenate synthesis responses. WAV-wrapped LINEAR16 keeps one header with the sizes fixed up; Ogg chains as-is."""
+    if not parts[0].startswith(b"RIFF"):
+        return b"".join(parts)
+    
+    pcm = b"".join(part[_WAV_HEADER_LEN:] if part.startswith(b"RIFF") else part for part in parts)
+    header = bytearray(parts[0][:_WAV_HEADER_LEN])
+    struct.pack_into("<I", header, 4, 36 + len(pcm))
+    struct.pack_into("<I", header, 40, len(pcm))
+    return bytes(header) + pcm
+
+_WHITESPACE_RE = re.compile(r"\s+")
+
+def _norm(text: str, normalize_case: bool = False) -> str:
+    # Cache-key form only - the original text is what gets synthesized
+    text = unicodedata.normalize("NFKC", _WHITESPACE_RE.sub(" ", text.strip()))
+    return text.lower() if normalize_case else text
+
+# Proto-plus messages are costly to build; the ones a call needs are immutable in practice, so share them
+@lru_cache(maxsize=32)
+def _voice_params(language_code: str, name: str, gender: Optional[int] = None) -> texttospeech.VoiceSelectionParams:
+    if gender is None:
+        return texttospeech.VoiceSelectionParams(language_code=language_code, name=name)
+    return texttospeech.VoiceSelectionParams(language_code=language_code, name=name, ssml_gender=gender)
+
+@lru_cache(maxsize=32)
+def _audio_config(encoding: int, speaking_rate: float, pitch: float) -> texttospeech.AudioConfig:
+    return texttospeech.AudioConfig(
+        audio_encoding=encoding,
+        sample_rate_hertz=16000,
+        speaking_rate=speaking_rate,
+        pitch=pitch
+    )
+
+@lru_cache(maxsize=64)
+def _cached_synthesis_input(text: str) -> texttospeech.SynthesisInput:
+    return texttospeech.SynthesisInput(text=text)
+
+def _synthesis_input(text: str) -> texttospeech.SynthesisInput:
+    # Only short strings repeat often enough to be worth holding on to
+    if len(text) <= 100:
+        return _cached_synthesis_input(text)
+    return texttospeech.SynthesisInput(text=text)
+
+def _create_async_client() -> texttospeech.TextToSpeechAsyncClient:
+    # One HTTP/2 channel multiplexes all in-flight syntheses; keepalive stops idle periods from dropping it
+    channel = TextToSpeechGrpcAsyncIOTransport.create_channel(options=[
+        ("grpc.keepalive_time_ms", 30000),
+        ("grpc.max_send_message_length", -1),
+        ("grpc.max_receive_message_length", -1),
+    ])
+    return texttospeech.TextToSpeechAsyncClient(transport=TextToSpeechGrpcAsyncIOTransport(channel=channel))
+
 class GoogleTTSClient:
     def __init__(self):
-        self.client = texttospeech.TextToSpeechClient()
+        self.client = _create_async_client()
+        # Token bucket that keeps bursts under the project's per-second quota
+        self.limiter = AsyncLimiter(settings.google_tts_qps, 1.0)
+        # Admission control: bounded concurrency, and a fast failure instead of an unbounded queue when saturated
+        self._admission = asyncio.Semaphore(settings.google_tts_max_inflight)
         
-        self.voice = texttospeech.VoiceSelectionParams(
+        self.voice = _voice_params("en-US", "en-US-Neural2-D", texttospeech.SsmlVoiceGender.FEMALE)
+        
+        # OGG_OPUS is ~8x smaller than LINEAR16, but the browser player expects raw PCM, so LINEAR16 stays the default
+        # AudioConfig is rebuilt (and memoized) from these rather than mutated under in-flight calls
+        self._encoding = getattr(texttospeech.AudioEncoding, settings.google_tts_encoding)
+        self._rate = 1.0
+        self._pitch = 0.0
+        # (voice, audio_config, request pb) for the hot voice/config; rebuilt when either changes
+        self._req_template = None
+        
+        # StreamingSynthesize only supports Chirp 3 HD voices
+        self.streaming_voice = texttospeech.VoiceSelectionParams(
             language_code="en-US",
-            name="en-US-Neural2-D",
-            ssml_gender=texttospeech.SsmlVoiceGender.FEMALE
+            name="en-US-Chirp3-HD-Aoede"
         )
-        
-        self.audio_config = texttospeech.AudioConfig(
-            audio_encoding=texttospeech.AudioEncoding.LINEAR16,
-            sample_rate_hertz=16000,
-            speaking_rate=1.0,
-            pitch=0.0
+        self.streaming_audio_config = texttospeech.StreamingAudioConfig(
+            audio_encoding=texttospeech.AudioEncoding.PCM,
+            sample_rate_hertz=16000
         )
         
         logger.info("Initialized Google TTS client")
     
-    def synthesize_speech(self, text: str, voice_name: Optional[str] = None) -> bytes:
+    @asynccontextmanager
+    async def _admitted(self):
         try:
-            synthesis_input = texttospeech.SynthesisInput(text=text)
-            voice = self.voice
-            if voice_name:
-                voice = texttospeech.VoiceSelectionParams(
-                    language_code="en-US",
-                    name=voice_name
-                )
+            await asyncio.wait_for(self._admission.acquire(), _ADMISSION_TIMEOUT)
+        except asyncio.TimeoutError:
+            raise core_exceptions.ResourceExhausted("Google TTS is at capacity")
+        
+        try:
+            yield
+        finally:
+            self._admission.release()
+    
+    @property
+    def audio_config(self) -> texttospeech.AudioConfig:
+        return _audio_config(self._encoding, self._rate, self._pitch)
+    
+    async def synthesize_speech(self, text: str, voice_name: Optional[str] = None) -> bytes:
+        with TTS_SYNTH_SECONDS.time():
+            try:
+                async with self._admitted():
+                    voice = _voice_params("en-US", voice_name) if voice_name else self.voice
+                    # Snapshot once so every piece of a split request uses the same settings
+                    audio_config = self.audio_config
+                    
+                    if len(text) > _SPLIT_THRESHOLD:
+                        pieces = _split_sentences(text)
+                        if len(pieces) > 1:
+                            audios = await asyncio.gather(*(self._synth_one(piece, voice, audio_config) for piece in pieces))
+                            logger.debug(f"Synthesized speech in {len(pieces)} parallel pieces")
+                            return _join_audio(audios)
+                    
+                    audio = await self._synth_one(text, voice, audio_config)
+                    logger.debug(f"Synthesized speech")
+                    return audio
             
-            response = self.client.synthesize_speech(
-                input=synthesis_input,
-                voice=voice,
-                audio_config=self.audio_config
+            except Exception as e:
+                logger.error(f"Error synthesizing speech: {e}")
+                raise
+    
+    async def _synth_one(
+        self,
+        text: str,
+        voice: texttospeech.VoiceSelectionParams,
+        audio_config: texttospeech.AudioConfig
+    ) -> bytes:
+        request = self._build_request(_synthesis_input(text), voice, audio_config)
+        async with self.limiter:
+            response = await self.client.synthesize_speech(
+                request=request,
+                retry=_RPC_RETRY,
+                timeout=_RPC_TIMEOUT
             )
-            
-            logger.debug(f"Synthesized speech")
-            return response.audio_content
+        return response.audio_content
+    
+    def _build_request(
+        self,
+        synthesis_input: texttospeech.SynthesisInput,
+        voice: texttospeech.VoiceSelectionParams,
+        audio_config: texttospeech.AudioConfig
+    ) -> texttospeech.SynthesizeSpeechRequest:
+        # voice/audio_config are memoized, so identity tells us whether the template still applies
+        template = self._req_template
+        if template is None or template[0] is not voice or template[1] is not audio_config:
+            template_pb = texttospeech.SynthesizeSpeechRequest.pb(
+                texttospeech.SynthesizeSpeechRequest(voice=voice, audio_config=audio_config)
+            )
+            template = self._req_template = (voice, audio_config, template_pb)
+        
+        # Copy at the protobuf level and only swap the input, skipping proto-plus marshalling per call
+        request_pb = type(template[2])()
+        request_pb.CopyFrom(template[2])
+        request_pb.input.CopyFrom(texttospeech.SynthesisInput.pb(synthesis_input))
+        return texttospeech.SynthesizeSpeechRequest.wrap(request_pb)
+    
+    async def stream_synthesize(self, text: str) -> AsyncIterator[bytes]:
+        """Yield raw 16kHz PCM as it is generated. Plain text only - SSML has to go through synthesize_speech."""
+        streaming_config = texttospeech.StreamingSynthesizeConfig(
+            voice=self.streaming_voice,
+            streaming_audio_config=self.streaming_audio_config
+        )
+        
+        async def requests():
+            yield texttospeech.StreamingSynthesizeRequest(streaming_config=streaming_config)
+            yield texttospeech.StreamingSynthesizeRequest(input=texttospeech.StreamingSynthesisInput(text=text))
+        
+        started = time.monotonic()
+        try:
+            async with self._admitted():
+                async with self.limiter:
+                    stream = await self.client.streaming_synthesize(requests=requests())
+                
+                responses = stream.__aiter__()
+                chunk_count = 0
+                while True:
+                    try:
+                        response = await asyncio.wait_for(responses.__anext__(), _STREAM_GAP_TIMEOUT)
+                    except StopAsyncIteration:
+                        break
+                    except asyncio.TimeoutError:
+                        stream.cancel()
+                        raise core_exceptions.DeadlineExceeded(f"Google TTS stream stalled after {chunk_count} chunks")
+                    
+                    if response.audio_content:
+                        chunk_count += 1
+                        if chunk_count == 1:
+                            TTS_STREAM_FIRST_CHUNK_SECONDS.observe(time.monotonic() - started)
+                            logger.debug("First Google TTS audio chunk received")
+                        yield response.audio_content
+                
+                TTS_STREAM_SECONDS.observe(time.monotonic() - started)
+                logger.debug(f"Completed Google TTS stream ({chunk_count} chunks)")
         
         except Exception as e:
-            logger.error(f"Error synthesizing speech: {e}")
+            logger.error(f"Error in streaming synthesis: {e}")
             raise
     
-    def synthesize_speech_base64(self, text: str) -> str:
-        audio_bytes = self.synthesize_speech(text)
+    async def synthesize_speech_base64(self, text: str) -> str:
+        """Deprecated: base64 adds 33% to the payload. Send synthesize_speech() bytes as a binary frame instead."""
+        warnings.warn(
+            "synthesize_speech_base64 is deprecated; send synthesize_speech() bytes with websocket.send_bytes",
+            DeprecationWarning,
+            stacklevel=2
+        )
+        audio_bytes = await self.synthesize_speech(text)
         return base64.b64encode(audio_bytes).decode('utf-8')
     
     def set_voice(self, language_code: str = "en-US", voice_name: str = "en-US-Neural2-D", gender: str = "FEMALE"):
@@ -58,44 +280,248 @@ class GoogleTTSClient:
             "NEUTRAL": texttospeech.SsmlVoiceGender.NEUTRAL
         }
         
-        self.voice = texttospeech.VoiceSelectionParams(
-            language_code=language_code,
-            name=voice_name,
-            ssml_gender=gender_map.get(gender, texttospeech.SsmlVoiceGender.FEMALE)
-        )
+        self.voice = _voice_params(language_code, voice_name, gender_map.get(gender, texttospeech.SsmlVoiceGender.FEMALE))
         
-        logger.info(f"Changed voice to: {voice_model}")
+        logger.info(f"Changed voice to: {voice_name}")
     
     def set_speaking_rate(self, rate: float):
         rate = max(0.25, min(4.0, rate))
-        self.audio_config.speaking_rate = rate
+        self._rate = rate
         logger.info(f"Set speaking rate: {rate}")
     
     def set_pitch(self, pitch: float):
         pitch = max(-20.0, min(20.0, pitch))
-        self.audio_config.pitch = pitch
+        self._pitch = pitch
         logger.info(f"Set pitch: {pitch}")
 
+class _Coalescer:
+    """Collects synthesize requests for a short window and issues each batch together over the shared channel."""
+    
+    def __init__(self, synthesize: Callable[[str], Awaitable[bytes]], window: float = 0.01, max_batch: int = 16):
+        self._synthesize = synthesize
+        self._window = window
+        self._max_batch = max_batch
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+        self._inflight = set()
+    
+    async def submit(self, text: str) -> bytes:
+        loop = asyncio.get_running_loop()
+        if self._worker is None:
+            self._queue = asyncio.Queue()
+            self._worker = loop.create_task(self._run())
+        
+        future = loop.create_future()
+        self._queue.put_nowait((text, future))
+        return await future
+    
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self._window
+            while len(batch) < self._max_batch:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), remaining))
+                except asyncio.TimeoutError:
+                    break
+            
+            # Don't hold the collector on a slow batch; the next window starts immediately
+            task = loop.create_task(self._run_batch(batch))
+            self._inflight.add(task)
+            task.add_done_callback(self._inflight.discard)
+    
+    async def _run_batch(self, batch: List[Tuple[str, asyncio.Future]]):
+        results = await asyncio.gather(*(self._synthesize(text) for text, _ in batch), return_exceptions=True)
+        for (_, future), result in zip(batch, results):
+            if future.done():
+                continue  # Caller went away
+            if isinstance(result, BaseException):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+
+class _SharedStream:
+    """One in-flight audio stream whose chunks are replayed to every caller asking for the same audio."""
+    
+    def __init__(self, source: AsyncIterator[bytes]):
+        self.chunks: List[bytes] = []
+        self.done = False
+        self.error: Optional[Exception] = None
+        self._changed = asyncio.Event()
+        # Runs on its own so a listener disconnecting doesn't stop the stream the others are reading
+        self.task = asyncio.create_task(self._pump(source))
+    
+    async def _pump(self, source: AsyncIterator[bytes]):
+        try:
+            async for chunk in source:
+                self.chunks.append(chunk)
+                self._notify()
+        except Exception as e:
+            self.error = e
+        finally:
+            self.done = True
+            self._notify()
+    
+    def _notify(self):
+        self._changed.set()
+        self._changed = asyncio.Event()
+    
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        sent = 0
+        while True:
+            while sent < len(self.chunks):
+                yield self.chunks[sent]
+                sent += 1
+            if self.done:
+                if self.error is not None:
+                    raise self.error
+                return
+            await self._changed.wait()
+
 class GoogleTTSManager:
-    def __init__(self):
+    def __init__(
+        self,
+        cache_max_bytes: int = settings.google_tts_cache_max_bytes,
+        backend: Optional[TTSCacheBackend] = None,
+        normalize_case: bool = False
+    ):
         self.client = GoogleTTSClient()
-        self.cache = {}
+        # LRU of synthesized audio bounded by total bytes; backend (if any) is the shared second tier
+        self.cache: "OrderedDict[str, bytes]" = OrderedDict()
+        self.backend = backend
+        self._cache_max_bytes = cache_max_bytes
+        self._cache_bytes = 0
+        # Off by default: casing can change how Google TTS stresses a word
+        self._normalize_case = normalize_case
+        self._coalescer = _Coalescer(self.client.synthesize_speech)
+        # Cache misses currently being synthesized; concurrent callers for the same key share one RPC
+        self._inflight: Dict[str, asyncio.Task] = {}
+        self._inflight_streams: Dict[str, _SharedStream] = {}
+        self._backend_writes = set()
         logger.info("Initialized Google TTS manager")
     
-    def synthesize(self, text: str, use_cache: bool = True) -> bytes:
-        if use_cache and text in self.cache:
-            logger.debug("Using cached audio")
-            return self.cache[text]
+    def _cache_key(self, text: str, voice: Optional[texttospeech.VoiceSelectionParams] = None) -> str:
+        # Everything that changes the audio is part of the key, so a voice/rate change can't serve stale audio
+        voice = voice or self.client.voice
+        audio_config = self.client.audio_config
+        prefix = f"{voice.language_code}|{voice.name}|{audio_config.audio_encoding}|{audio_config.speaking_rate}|{audio_config.pitch}|"
+        return hashlib.sha256(prefix.encode() + _norm(text, self._normalize_case).encode()).hexdigest()
+    
+    def _cache_get(self, key: str) -> Optional[bytes]:
+        audio = self.cache.get(key)
+        if audio is not None:
+            self.cache.move_to_end(key)
+        return audio
+    
+    def _cache_put(self, key: str, audio: bytes):
+        previous = self.cache.pop(key, None)
+        if previous is not None:
+            self._cache_bytes -= len(previous)
+        
+        self.cache[key] = audio
+        self._cache_bytes += len(audio)
+        
+        while self.cache and self._cache_bytes > self._cache_max_bytes:
+            _, evicted = self.cache.popitem(last=False)
+            self._cache_bytes -= len(evicted)
+    
+    async def _lookup(self, key: str) -> Optional[bytes]:
+        audio = self._cache_get(key)
+        if audio is None and self.backend is not None:
+            audio = await self.backend.get(key)
+            if audio is not None:
+                self._cache_put(key, audio)
+        return audio
+    
+    def _store(self, key: str, audio: bytes):
+        self._cache_put(key, audio)
+        if self.backend is not None:
+            # The shared tier is written in the background so a slow write never delays the response
+            task = asyncio.create_task(self.backend.set(key, audio))
+            self._backend_writes.add(task)
+            task.add_done_callback(self._backend_writes.discard)
+    
+    async def synthesize(self, text: str, use_cache: bool = True) -> bytes:
+        if not use_cache:
+            audio = await self._coalescer.submit(text)
+            TTS_BYTES_RETURNED.inc(len(audio))
+            return audio
         
-        audio = self.client.synthesize_speech(text)
+        cache_key = self._cache_key(text)
+        cached = await self._lookup(cache_key)
+        if cached is not None:
+            logger.debug("Using cached audio")
+            TTS_CACHE_HITS.inc()
+            TTS_BYTES_RETURNED.inc(len(cached))
+            return cached
         
-        if use_cache and len(text) < 100:
-            self.cache[text] = audio
+        TTS_CACHE_MISSES.inc()
+        task = self._inflight.get(cache_key)
+        if task is None:
+            task = asyncio.create_task(self._synthesize_and_store(cache_key, text))
+            self._inflight[cache_key] = task
+            task.add_done_callback(lambda t: self._inflight_done(cache_key, t))
         
+        # Shielded so one caller going away doesn't cancel the synthesis the others are waiting on
+        audio = await asyncio.shield(task)
+        TTS_BYTES_RETURNED.inc(len(audio))
         return audio
     
+    async def _synthesize_and_store(self, cache_key: str, text: str) -> bytes:
+        audio = await self._coalescer.submit(text)
+        self._store(cache_key, audio)
+        return audio
+    
+    def _inflight_done(self, cache_key: str, task: asyncio.Task):
+        self._inflight.pop(cache_key, None)
+        if not task.cancelled():
+            task.exception()  # Mark retrieved in case every waiter was cancelled
+    
+    async def synthesize_streaming(self, text: str) -> AsyncIterator[bytes]:
+        cache_key = self._cache_key(text, self.client.streaming_voice)
+        cached = await self._lookup(cache_key)
+        if cached is not None:
+            logger.debug("Using cached audio")
+            TTS_CACHE_HITS.inc()
+            TTS_BYTES_RETURNED.inc(len(cached))
+            yield cached
+            return
+        
+        TTS_CACHE_MISSES.inc()
+        # Concurrent requests for the same prompt read one StreamingSynthesize call instead of opening their own
+        shared = self._inflight_streams.get(cache_key)
+        if shared is None:
+            shared = _SharedStream(self._stream_and_store(cache_key, text))
+            self._inflight_streams[cache_key] = shared
+            shared.task.add_done_callback(lambda t: self._inflight_streams.pop(cache_key, None))
+        
+        async for chunk in shared:
+            TTS_BYTES_RETURNED.inc(len(chunk))
+            yield chunk
+    
+    async def _stream_and_store(self, cache_key: str, text: str) -> AsyncIterator[bytes]:
+        buf = bytearray()
+        async for chunk in self.client.stream_synthesize(text):
+            buf.extend(chunk)
+            yield chunk
+        
+        self._store(cache_key, bytes(buf))
+    
+    async def warmup(self):
+        """Open the gRPC channel and fetch credentials before the first real request needs them."""
+        try:
+            await self.client.synthesize_speech("Hi")
+            logger.info("Google TTS channel warmed up")
+        except Exception as e:
+            logger.warning(f"Google TTS warmup failed: {e}")
+    
     def clear_cache(self):
         self.cache.clear()
+        self._cache_bytes = 0
         logger.info("Cleared TTS cache")
 
 # Lazy initialization - only create when needed (allows Cloud Run to use default credentials)
@@ -104,8 +530,13 @@ _tts_manager = None
 def get_tts_manager():
     global _tts_manager
     if _tts_manager is None:
+        # Settings come from .env, which the Google auth library never reads
+        if settings.google_application_credentials:
+            os.environ.setdefault("GOOGLE_APPLICATION_CREDENTIALS", settings.google_application_credentials)
+        
         try:
-            _tts_manager = GoogleTTSManager()
+            backend = RedisCache(settings.redis_url, ttl=settings.google_tts_cache_ttl) if settings.redis_url else None
+            _tts_manager = GoogleTTSManager(backend=backend)
             logger.info("Initialized Google TTS manager")
         except Exception as e:
             logger.warning(f"Failed to initialize Google TTS manager: {e}. TTS will not be available.")
@@ -66,6 +66,7 @@ gcloud run deploy ${SERVICE_NAME} \
     --cpu 1 \
     --timeout 300 \
     --max-instances 10 \
+    --min-instances 1 \
     --set-env-vars="${ENV_VARS},ENVIRONMENT=production,FRONTEND_URL=https://nextdimensionai.vercel.app" \
     --quiet
 